@@ -0,0 +1 @@
+'''Shared tooling for running, timing and profiling the daily solutions.'''
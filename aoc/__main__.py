@@ -0,0 +1,27 @@
+'''Runs a single day's solution, the one place that makes the aoc package and the day's
+sibling modules importable, so the day scripts don't each have to patch sys.path.
+
+Run it from the repository root, since the days read their puzzle input from dayNN/.
+Given input files, the day is solved for each of them in batch mode instead (see aoc.batch).
+
+Usage: python -m aoc DAY
+   or: python -m aoc DAY INPUT [INPUT ...] [--workers N]
+'''
+from argparse import ArgumentParser
+
+from aoc.runner import load_day, normalize_day
+
+def main():
+    parser = ArgumentParser(prog='python -m aoc', description="Run a day's solution on its puzzle input, or on many inputs in batch mode.")
+    parser.add_argument('day', help='day to run (e.g. 7 or day07)')
+    args, batch_args = parser.parse_known_args()
+
+    day = normalize_day(args.day)
+    if batch_args:
+        from aoc.batch import batch_main
+        batch_main(day, batch_args)
+    else:
+        load_day(day).main()
+
+if __name__ == '__main__':
+    main()
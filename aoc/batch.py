@@ -0,0 +1,75 @@
+'''Solves a day for many input files in a single process, streaming the results as JSON lines.
+
+The interpreter, NumPy and the day's modules are loaded once and reused for every input,
+optionally across a pool of worker processes that each load them once. Results are written
+in the order the inputs were given, one JSON object per line, as soon as each is ready.
+Inputs can be files, directories (every .txt file inside) or glob patterns.
+
+Usage: python -m aoc.batch DAY INPUT [INPUT ...] [--workers N]
+   or: python -m aoc DAY INPUT [INPUT ...] [--workers N]
+'''
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from functools import partial
+from glob import glob, has_magic
+import json
+from os.path import isdir, join
+import sys
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from aoc.runner import PARTS, load_day, normalize_day, run_day
+
+def expand_inputs(patterns: List[str]) -> List[str]:
+    '''Expands each directory or glob pattern into the sorted input files it matches.'''
+    input_paths = []
+    for pattern in patterns:
+        if isdir(pattern):
+            input_paths += sorted(glob(join(pattern, '*.txt')))
+        elif has_magic(pattern):
+            input_paths += sorted(glob(pattern))
+        else:
+            input_paths.append(pattern)
+    return input_paths
+
+def solve_input(day: str, parts: List[str], input_path: str) -> Dict[str, Any]:
+    '''Solves the day for a single input file, returning the result as a JSON-serializable dict.'''
+    return {'input': input_path, **asdict(run_day(day, input_path, parts))}
+
+def solve_inputs(day: str, input_paths: List[str], parts: List[str] = PARTS, workers: int = 1) -> Iterator[Dict[str, Any]]:
+    '''Solves the day for each input file, yielding the results in the same order as the inputs.'''
+    solve = partial(solve_input, day, parts)
+    if workers <= 1:
+        load_day(day)
+        yield from map(solve, input_paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_day, initargs=(day,)) as executor:
+        yield from executor.map(solve, input_paths, chunksize=max(1, len(input_paths) // (workers * 4)))
+
+def run_batch(day: str, patterns: List[str], parts: List[str] = PARTS, workers: int = 1, output: Optional[TextIO] = None) -> int:
+    '''Solves the day for every input matched by the patterns, streaming the results to the output.
+    Returns the number of inputs that failed.'''
+    output = sys.stdout if output is None else output
+    num_failed = 0
+    for result in solve_inputs(day, expand_inputs(patterns), parts, workers):
+        output.write(json.dumps(result) + '\n')
+        output.flush()
+        num_failed += result['error'] is not None
+    return num_failed
+
+def batch_main(day: Optional[str] = None, args: Optional[List[str]] = None) -> None:
+    '''Parses the command line for a batch run, of the given day if there is one, and runs it.'''
+    parser = ArgumentParser(description='Solve a day for many input files, writing one JSON result per line.')
+    if day is None:
+        parser.add_argument('day', help='day to solve (e.g. 7 or day07)')
+    parser.add_argument('inputs', nargs='+', help='input files, directories or glob patterns')
+    parser.add_argument('--parts', nargs='+', default=PARTS, choices=PARTS, help='parts to run')
+    parser.add_argument('--workers', type=int, default=1, help='number of worker processes')
+    parsed = parser.parse_args(args)
+
+    day = normalize_day(parsed.day if day is None else day)
+    if run_batch(day, parsed.inputs, parsed.parts, parsed.workers) > 0:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    batch_main()
@@ -0,0 +1,176 @@
+'''Benchmarks each day on generated inputs of increasing size, recording wall time and peak memory.
+
+Every measurement runs in a fresh process so that memory use and timeouts are isolated.
+The growth column is the exponent relating the total time to the scale since the
+previous scale, so roughly 1 is linear and 2 or more points at a quadratic blowup.
+
+Usage: python -m aoc.bench [DAY ...] [--scales 1 10 100] [--repeat N] [--timeout SECONDS] [--json PATH]
+'''
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass, field
+import json
+from math import log
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from os import makedirs
+from os.path import join
+from statistics import median
+from tempfile import TemporaryDirectory
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from aoc.generators import GENERATORS, generate_input
+from aoc.runner import PHASES, format_time, load_day, normalize_day, run_day
+
+DEFAULT_SCALES = [1, 10, 100]
+
+@dataclass
+class BenchResult:
+    '''The median time of each phase and the peak traced memory (in KiB) for a day at a given scale.'''
+    day: str
+    scale: int
+    input_bytes: int
+    timings: Dict[str, float] = field(default_factory=dict)
+    peak_memory_kb: Optional[int] = None
+    status: str = 'ok'
+
+    def total_time(self) -> float:
+        '''Computes the total of the median times across all phases.'''
+        return sum(self.timings.values())
+
+def measure_time(day: str, input_path: str, parts: List[str], repeat: int) -> Dict[str, float]:
+    '''Runs the day on the input the given number of times, returning the median time of each phase.'''
+    runs = [run_day(day, input_path, parts) for _ in range(repeat)]
+    for run in runs:
+        if run.error is not None:
+            raise RuntimeError(run.error)
+    return {phase: median(run.timings[phase] for run in runs) for phase in PHASES if phase in runs[0].timings}
+
+def measure_memory(day: str, input_path: str, parts: List[str]) -> int:
+    '''Runs the day on the input once while tracing allocations, returning the peak memory in KiB.'''
+    load_day(day)
+    tracemalloc.start()
+    try:
+        run = run_day(day, input_path, parts)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    if run.error is not None:
+        raise RuntimeError(run.error)
+    return peak // 1024
+
+def measure_worker(connection: Connection, day: str, input_path: str, parts: List[str], repeat: int) -> None:
+    '''Takes the measurements in a worker process, sending each result (or error) back through the connection.
+    Tracing allocations slows everything down, so memory is measured in a separate run after the timed runs.'''
+    try:
+        connection.send(measure_time(day, input_path, parts, repeat))
+        connection.send(measure_memory(day, input_path, parts))
+    except Exception as error:
+        connection.send(error)
+
+def measure_in_process(day: str, input_path: str, parts: List[str], repeat: int, timeout: float) -> Tuple[Dict[str, float], Optional[int], str]:
+    '''Takes the measurements in a fresh process, giving up on each once the timeout has passed.
+    Returns the timings, the peak memory and a status.'''
+    context = get_context('spawn')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=measure_worker, args=(sender, day, input_path, parts, repeat))
+    process.start()
+    sender.close()
+    timings = {}
+    peak_memory_kb = None
+    try:
+        if not receiver.poll(timeout):
+            return timings, peak_memory_kb, 'timeout'
+        timings = receiver.recv()
+        if isinstance(timings, Exception):
+            return {}, peak_memory_kb, f'error: {timings}'
+        # The timings are still worth keeping if the memory run is too slow
+        if receiver.poll(timeout):
+            peak_memory_kb = receiver.recv()
+            if isinstance(peak_memory_kb, Exception):
+                return timings, None, f'error: {peak_memory_kb}'
+    except EOFError:
+        return timings, peak_memory_kb, f'worker exited with code {process.exitcode}'
+    finally:
+        process.terminate()
+        process.join()
+    return timings, peak_memory_kb, 'ok'
+
+def run_benchmarks(days: List[str], scales: List[int], repeat: int = 1, timeout: float = 60, seed: int = 0, input_dir: Optional[str] = None) -> List[BenchResult]:
+    '''Benchmarks each day at each scale. Once a day times out, its larger scales are skipped.
+    Generated inputs are written to the input directory, or a temporary directory if none is given.'''
+    with TemporaryDirectory() as temp_dir:
+        if input_dir is None:
+            input_dir = temp_dir
+        makedirs(input_dir, exist_ok=True)
+        results = []
+        for day in days:
+            generator = GENERATORS[day]
+            timed_out = False
+            for scale in sorted(scales):
+                input_str = generate_input(day, scale, seed)
+                input_path = join(input_dir, f'{day}_x{scale}.txt')
+                with open(input_path, 'w') as input_file:
+                    input_file.write(input_str)
+                result = BenchResult(day, scale, len(input_str))
+                if timed_out:
+                    result.status = 'skipped'
+                else:
+                    result.timings, result.peak_memory_kb, result.status = measure_in_process(day, input_path, generator.parts, repeat, timeout)
+                    timed_out = result.status == 'timeout'
+                results.append(result)
+                print_result(result, results)
+        return results
+
+def get_growth(result: BenchResult, results: List[BenchResult]) -> Optional[float]:
+    '''Computes the exponent relating the total time to the scale, compared to the previous scale.'''
+    previous = [other for other in results if other.day == result.day and other.scale < result.scale and other.status == 'ok']
+    if result.status != 'ok' or len(previous) == 0:
+        return None
+    previous = previous[-1]
+    if previous.total_time() <= 0 or result.total_time() <= 0:
+        return None
+    return log(result.total_time() / previous.total_time()) / log(result.scale / previous.scale)
+
+def print_header() -> None:
+    '''Prints the header of the results table.'''
+    print(f'{"Day":<6} {"Scale":>6} {"Input":>10} {"Parse":>10} {"Part 1":>10} {"Part 2":>10} {"Peak mem":>10} {"Growth":>7}')
+
+def print_result(result: BenchResult, results: List[BenchResult]) -> None:
+    '''Prints a row of the results table.'''
+    row = f'{result.day:<6} {result.scale:>5}x {result.input_bytes // 1024:>7} KiB '
+    if result.status != 'ok':
+        print(row + result.status)
+        return
+    row += ' '.join(f'{format_time(result.timings.get(phase)):>10}' for phase in PHASES)
+    if result.peak_memory_kb is None:
+        row += f' {"-":>10}'
+    else:
+        row += f' {result.peak_memory_kb / 1024:>6.1f} MiB'
+    growth = get_growth(result, results)
+    row += f' {"-" if growth is None else f"{growth:.2f}":>7}'
+    print(row, flush=True)
+
+def main():
+    parser = ArgumentParser(description='Benchmark each day on generated inputs of increasing size.')
+    parser.add_argument('days', nargs='*', help='days to benchmark (e.g. 7 or day07), defaults to all days with a generator')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES, help='input sizes relative to a real puzzle input')
+    parser.add_argument('--repeat', type=int, default=1, help='number of runs to take the median of')
+    parser.add_argument('--timeout', type=float, default=60, help='seconds to allow for each measurement')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the input generators')
+    parser.add_argument('--input-dir', default=None, help='directory to keep the generated inputs in')
+    parser.add_argument('--json', default=None, help='file to write the results to as JSON')
+    args = parser.parse_args()
+
+    days = [normalize_day(day) for day in args.days] if args.days else list(GENERATORS)
+    for day in days:
+        if day not in GENERATORS:
+            parser.error(f'{day} has no input generator')
+    print_header()
+    results = run_benchmarks(days, args.scales, args.repeat, args.timeout, args.seed, args.input_dir)
+    if args.json is not None:
+        with open(args.json, 'w') as json_file:
+            json.dump([asdict(result) for result in results], json_file, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+'''An opt-in on-disk cache of parsed inputs.
+
+Entries are keyed by a hash of the input file's contents and of the parser's version,
+which is a hash of the source of the day's modules and the shared loader. Editing either
+the input or the parser changes the key, so stale entries are never read. Arrays are
+stored as .npz files and everything else (such as object graphs) is pickled.
+
+Usage: python -m aoc.cache --clear
+'''
+from argparse import ArgumentParser
+from glob import glob
+from hashlib import blake2b
+from inspect import getsourcefile
+from os import makedirs, remove, replace
+from os.path import abspath, dirname, exists, join
+import pickle
+import sys
+from typing import Any, Callable
+
+from aoc import loader
+from aoc.loader import check_exists
+
+CACHE_DIR = join(dirname(dirname(abspath(__file__))), '.aoc_cache')
+CHUNK_SIZE = 1 << 20
+
+def hash_file(path: str, digest: blake2b) -> None:
+    '''Feeds the contents of the file into the digest, a chunk at a time.'''
+    with open(path, 'rb') as input_file:
+        while chunk := input_file.read(CHUNK_SIZE):
+            digest.update(chunk)
+
+def get_parser_version(load_input: Callable[[str], Any]) -> str:
+    '''Hashes the source of every module in the parser's directory along with the shared loader.'''
+    digest = blake2b(digest_size=16)
+    source_paths = sorted(glob(join(dirname(abspath(getsourcefile(load_input))), '*.py')))
+    for source_path in source_paths + [abspath(getsourcefile(loader))]:
+        hash_file(source_path, digest)
+    return digest.hexdigest()
+
+def get_cache_key(load_input: Callable[[str], Any], path: str) -> str:
+    '''Computes the cache key for parsing the input file with the given parser.'''
+    check_exists(path)
+    digest = blake2b(digest_size=16)
+    hash_file(path, digest)
+    digest.update(get_parser_version(load_input).encode())
+    return digest.hexdigest()
+
+def write_atomically(path: str, write: Callable[[Any], None]) -> None:
+    '''Writes a file through a temporary file so a partially written entry is never read.'''
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'wb') as cache_file:
+        write(cache_file)
+    replace(temp_path, path)
+
+def read_entry(key: str) -> Any:
+    '''Reads the cached parse for the key, raising a KeyError if there isn't one.'''
+    npz_path = join(CACHE_DIR, f'{key}.npz')
+    if exists(npz_path):
+        import numpy as np
+
+        with np.load(npz_path) as npz_file:
+            return npz_file['data']
+    pickle_path = join(CACHE_DIR, f'{key}.pickle')
+    if exists(pickle_path):
+        with open(pickle_path, 'rb') as pickle_file:
+            return pickle.load(pickle_file)
+    raise KeyError(key)
+
+def write_entry(key: str, data: Any) -> None:
+    '''Writes the parsed data to the cache under the key.'''
+    makedirs(CACHE_DIR, exist_ok=True)
+    # If NumPy hasn't been imported, the parser can't have returned an array
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(data, np.ndarray):
+        write_atomically(join(CACHE_DIR, f'{key}.npz'), lambda cache_file: np.savez(cache_file, data=data))
+    else:
+        write_atomically(join(CACHE_DIR, f'{key}.pickle'), lambda cache_file: pickle.dump(data, cache_file, pickle.HIGHEST_PROTOCOL))
+
+def cached_load(load_input: Callable[[str], Any], path: str) -> Any:
+    '''Parses the input with the given parser, reusing a cached parse when neither has changed.'''
+    key = get_cache_key(load_input, path)
+    try:
+        return read_entry(key)
+    except KeyError:
+        data = load_input(path)
+        write_entry(key, data)
+        return data
+
+def clear_cache() -> int:
+    '''Removes every cache entry, returning the number removed.'''
+    cache_paths = glob(join(CACHE_DIR, '*'))
+    for cache_path in cache_paths:
+        remove(cache_path)
+    return len(cache_paths)
+
+def main():
+    parser = ArgumentParser(description='Manage the cache of parsed inputs.')
+    parser.add_argument('--clear', action='store_true', help='remove every cached parse')
+    args = parser.parse_args()
+
+    if args.clear:
+        print(f'Removed {clear_cache()} cached parses.')
+    else:
+        num_entries = len(glob(join(CACHE_DIR, '*')))
+        print(f'{num_entries} cached parses in {CACHE_DIR}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,421 @@
+'''Seeded generators that build valid puzzle inputs of any size for each day.
+
+A scale of 1 produces an input about the size of a real puzzle input. Grid-based
+days grow their area with the scale, so a scale of 100 gives 10x the width and
+10x the height. Days 21 and 23 have fixed-size inputs, so the scale is ignored,
+and day 24 has no generator since its answers are only valid for the real MONAD.
+'''
+from dataclasses import dataclass, field
+from math import isqrt
+from random import Random
+from typing import Callable, Dict, List, Tuple
+
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+SEGMENTS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+OPENERS = '([{<'
+CLOSERS = ')]}>'
+
+@dataclass
+class Generator:
+    '''An input generator for a day, along with the parts that can be run on its output.'''
+    generate: Callable[[Random, int], str]
+    parts: List[str] = field(default_factory=lambda: ['part_1', 'part_2'])
+
+def scale_side(side: int, scale: int) -> int:
+    '''Scales the side of a grid so that its area grows with the scale.'''
+    return max(1, isqrt(side * side * scale))
+
+def generate_day01(rng: Random, scale: int) -> str:
+    '''Generates a random walk of depths.'''
+    depth = rng.randint(100, 200)
+    depths = []
+    for _ in range(2000 * scale):
+        depth = max(0, depth + rng.randint(-10, 20))
+        depths.append(f'{depth}\n')
+    return ''.join(depths)
+
+def generate_day02(rng: Random, scale: int) -> str:
+    '''Generates a course of forward, down and up steps.'''
+    steps = []
+    for _ in range(1000 * scale):
+        direction = rng.choice(['forward', 'forward', 'down', 'down', 'up'])
+        steps.append(f'{direction} {rng.randint(1, 9)}\n')
+    return ''.join(steps)
+
+def generate_report_values(rng: Random, num_values: int, num_bits: int) -> List[int]:
+    '''Generates unique values where every group of values sharing a prefix has both a 0 and a 1 in the next bit.
+    This keeps the rating filters from ever discarding every remaining value.'''
+    if num_values == 1:
+        return [rng.getrandbits(num_bits) if num_bits > 0 else 0]
+    capacity = 2 ** (num_bits - 1)
+    num_zeros = rng.randint(max(1, num_values - capacity), min(num_values - 1, capacity))
+    zeros = generate_report_values(rng, num_zeros, num_bits - 1)
+    ones = generate_report_values(rng, num_values - num_zeros, num_bits - 1)
+    return zeros + [capacity + value for value in ones]
+
+def generate_day03(rng: Random, scale: int) -> str:
+    '''Generates a diagnostic report, widening the numbers from 12 bits as needed.'''
+    num_rows = 1000 * scale
+    num_bits = max(12, num_rows.bit_length() + 2)
+    values = generate_report_values(rng, num_rows, num_bits)
+    rng.shuffle(values)
+    return ''.join(f'{value:0{num_bits}b}\n' for value in values)
+
+def generate_day04(rng: Random, scale: int) -> str:
+    '''Generates the called numbers and bingo boards.'''
+    called_numbers = list(range(100))
+    rng.shuffle(called_numbers)
+    sections = [','.join(str(number) for number in called_numbers) + '\n']
+    for _ in range(100 * scale):
+        numbers = rng.sample(range(100), 25)
+        rows = [' '.join(f'{number:>2}' for number in numbers[row:row+5]) for row in range(0, 25, 5)]
+        sections.append('\n'.join(rows) + '\n')
+    return '\n'.join(sections)
+
+def generate_day05(rng: Random, scale: int) -> str:
+    '''Generates horizontal, vertical and diagonal vents.'''
+    # Coordinates stay within a 1000x1000 grid, so only the number of vents grows
+    vents = []
+    for _ in range(500 * scale):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        kind = rng.randrange(3)
+        if kind == 0:
+            x2, y2 = x1, rng.randrange(1000)
+        elif kind == 1:
+            x2, y2 = rng.randrange(1000), y1
+        else:
+            length = rng.randint(-min(x1, y1), 999 - max(x1, y1))
+            x2, y2 = x1 + length, y1 + length
+        vents.append(f'{x1},{y1} -> {x2},{y2}\n')
+    return ''.join(vents)
+
+def generate_day06(rng: Random, scale: int) -> str:
+    '''Generates the lanternfish timers.'''
+    return ','.join(str(rng.randint(1, 5)) for _ in range(300 * scale)) + '\n'
+
+def generate_day07(rng: Random, scale: int) -> str:
+    '''Generates the crab positions, clustered near the start like the real input.'''
+    return ','.join(str(int(rng.expovariate(1 / 400)) % 2000) for _ in range(1000 * scale)) + '\n'
+
+def generate_day08(rng: Random, scale: int) -> str:
+    '''Generates scrambled seven segment displays.'''
+    entries = []
+    for _ in range(200 * scale):
+        wires = list('abcdefg')
+        rng.shuffle(wires)
+        wiring = dict(zip('abcdefg', wires))
+        scrambled = [''.join(rng.sample([wiring[segment] for segment in digit], len(digit))) for digit in SEGMENTS]
+        digits = rng.sample(scrambled, 10)
+        value = [rng.choice(scrambled) for _ in range(4)]
+        entries.append(f'{" ".join(digits)} | {" ".join(value)}\n')
+    return ''.join(entries)
+
+def generate_day09(rng: Random, scale: int) -> str:
+    '''Generates a height map.'''
+    # Split the map into rectangular basins separated by walls of 9s, each with a single low point
+    side = scale_side(100, scale)
+    heights = [[9] * side for _ in range(side)]
+    row = 0
+    while row < side:
+        band_height = rng.randint(3, 12)
+        col = 0
+        while col < side:
+            block_width = rng.randint(3, 12)
+            rows = range(row, min(row + band_height, side))
+            cols = range(col, min(col + block_width, side))
+            low_row, low_col = rng.choice(rows), rng.choice(cols)
+            for i in rows:
+                for j in cols:
+                    heights[i][j] = min(8, abs(i - low_row) + abs(j - low_col))
+            col += block_width + 1
+        row += band_height + 1
+    return ''.join(''.join(str(height) for height in heights_row) + '\n' for heights_row in heights)
+
+def generate_day10(rng: Random, scale: int) -> str:
+    '''Generates corrupted and incomplete lines of navigation subsystem.'''
+    lines = []
+    num_lines = 110 * scale
+    if num_lines % 2 == 0:
+        num_lines += 1
+    for idx in range(num_lines):
+        # Odd lines are incomplete, even lines are corrupted (so there is an odd number of incomplete lines)
+        corrupted = idx % 2 == 0
+        length = rng.randint(60, 110)
+        line = ''
+        opens = []
+        while len(line) < length or len(opens) == 0:
+            if len(opens) > 0 and rng.random() < 0.45:
+                line += CLOSERS[opens.pop()]
+            else:
+                opens.append(rng.randrange(4))
+                line += OPENERS[opens[-1]]
+        if corrupted:
+            wrong = rng.choice([closer for closer in range(4) if closer != opens[-1]])
+            line += CLOSERS[wrong]
+        lines.append(line + '\n')
+    return ''.join(lines)
+
+def generate_day11(rng: Random, scale: int) -> str:
+    '''Generates a square grid of octopus energy levels.'''
+    side = scale_side(10, scale)
+    return ''.join(''.join(str(rng.randint(1, 9)) for _ in range(side)) + '\n' for _ in range(side))
+
+def generate_day12(rng: Random, scale: int) -> str:
+    '''Generates a cave system.'''
+    # Big caves are never linked to each other, otherwise there would be infinitely many paths.
+    # The number of paths grows exponentially with the number of caves, so the caves only grow
+    # with the log of the scale, otherwise anything past a scale of 3 couldn't be counted at all
+    names = set()
+    def new_name(is_big: bool) -> str:
+        while True:
+            name = ''.join(rng.choice(LETTERS) for _ in range(2))
+            name = name if is_big else name.lower()
+            if name not in names and name.lower() not in ['start', 'end']:
+                names.add(name)
+                return name
+    extra_caves = (scale - 1).bit_length()
+    num_small = 5 + extra_caves
+    num_big = 2 + extra_caves // 2
+    small = ['start', 'end'] + [new_name(False) for _ in range(num_small)]
+    big = [new_name(True) for _ in range(num_big)]
+    # Use a dict rather than a set so the order of the links is reproducible
+    links = {}
+    for cave in small[2:]:
+        links[(cave, rng.choice(big))] = True
+    for _ in range(2 * num_small):
+        cave_1, cave_2 = rng.sample(small, 2)
+        links[(cave_1, cave_2)] = True
+    for cave in big:
+        links[(rng.choice(small[:2]), cave)] = True
+    return ''.join(f'{cave_1}-{cave_2}\n' for cave_1, cave_2 in links)
+
+def generate_day13(rng: Random, scale: int) -> str:
+    '''Generates a transparent sheet of dots and its folds.'''
+    # Unfold a 40x6 sheet until it is the right size, then place dots off the fold lines
+    extra_folds = max(0, (scale - 1).bit_length() // 2)
+    x_folds = []
+    width = 40
+    for _ in range(5 + extra_folds):
+        x_folds.append(width)
+        width = (2 * width) + 1
+    y_folds = []
+    height = 6
+    for _ in range(7 + extra_folds):
+        y_folds.append(height)
+        height = (2 * height) + 1
+    dots = set()
+    while len(dots) < min(800 * scale, (width * height) // 4):
+        x, y = rng.randrange(width), rng.randrange(height)
+        if x not in x_folds and y not in y_folds:
+            dots.add((x, y))
+    folds = [f'fold along x={fold}\n' for fold in reversed(x_folds)]
+    folds += [f'fold along y={fold}\n' for fold in reversed(y_folds)]
+    return ''.join(f'{x},{y}\n' for x, y in dots) + '\n' + ''.join(folds)
+
+def generate_day14(rng: Random, scale: int) -> str:
+    '''Generates a polymer template with a rule for every pair of elements.'''
+    elements = rng.sample(LETTERS, 10)
+    polymer = ''.join(rng.choice(elements) for _ in range(20 * scale))
+    rules = [f'{a}{b} -> {rng.choice(elements)}\n' for a in elements for b in elements]
+    return f'{polymer}\n\n' + ''.join(rules)
+
+def generate_day15(rng: Random, scale: int) -> str:
+    '''Generates a square grid of risk levels.'''
+    side = scale_side(100, scale)
+    return ''.join(''.join(str(rng.randint(1, 9)) for _ in range(side)) + '\n' for _ in range(side))
+
+def generate_packet(rng: Random, num_packets: int, depth: int = 0) -> Tuple[str, int]:
+    '''Generates a packet (as bits) containing roughly the given number of packets.
+    Returns the bits and the number of packets actually generated.'''
+    version = f'{rng.randrange(8):03b}'
+    if num_packets <= 1 or depth > 8:
+        value = rng.getrandbits(rng.randint(1, 16))
+        groups = f'{value:b}'
+        groups = groups.zfill(-(-len(groups) // 4) * 4)
+        bits = ''
+        for idx in range(0, len(groups), 4):
+            bits += ('0' if idx + 4 == len(groups) else '1') + groups[idx:idx+4]
+        return version + '100' + bits, 1
+    type_id = rng.choice([0, 1, 2, 3, 5, 6, 7])
+    num_subpackets = 2 if type_id >= 5 else rng.randint(2, 6)
+    subpackets = ''
+    total_packets = 1
+    for _ in range(num_subpackets):
+        bits, count = generate_packet(rng, (num_packets - 1) // num_subpackets, depth + 1)
+        subpackets += bits
+        total_packets += count
+    if len(subpackets) < 2 ** 15 and rng.random() < 0.5:
+        header = '0' + f'{len(subpackets):015b}'
+    else:
+        header = '1' + f'{num_subpackets:011b}'
+    return version + f'{type_id:03b}' + header + subpackets, total_packets
+
+def generate_day16(rng: Random, scale: int) -> str:
+    '''Generates a BITS transmission.'''
+    # Wrap the packets in a sum packet so the outer packet can hold as many as needed
+    num_packets = 200 * scale
+    subpackets = ''
+    count = 0
+    num_subpackets = 0
+    while count < num_packets:
+        bits, generated = generate_packet(rng, min(num_packets - count, 200))
+        subpackets += bits
+        count += generated
+        num_subpackets += 1
+    bits = '000' + '000' + '1' + f'{num_subpackets:011b}' + subpackets
+    bits += '0' * (-len(bits) % 4)
+    return ''.join(f'{int(bits[idx:idx+4], base=2):X}' for idx in range(0, len(bits), 4)) + '\n'
+
+def generate_day17(rng: Random, scale: int) -> str:
+    '''Generates a target area below and to the right of the probe.'''
+    factor = isqrt(scale * 100) / 10
+    x_min = int(rng.randint(100, 150) * factor)
+    x_max = x_min + int(rng.randint(20, 50) * factor)
+    y_max = -int(rng.randint(60, 80) * factor)
+    y_min = y_max - int(rng.randint(20, 50) * factor)
+    return f'target area: x={x_min}..{x_max}, y={y_min}..{y_max}\n'
+
+def generate_sf_num(rng: Random, depth: int = 0) -> str:
+    '''Generates a reduced snailfish number.'''
+    if depth == 4 or (depth > 0 and rng.random() < 0.3):
+        return str(rng.randrange(10))
+    return f'[{generate_sf_num(rng, depth + 1)},{generate_sf_num(rng, depth + 1)}]'
+
+def generate_day18(rng: Random, scale: int) -> str:
+    '''Generates a list of reduced snailfish numbers.'''
+    lines = []
+    while len(lines) < 100 * scale:
+        sf_str = generate_sf_num(rng)
+        if sf_str.startswith('['):
+            lines.append(sf_str + '\n')
+    return ''.join(lines)
+
+def random_rotation(rng: Random) -> List[List[int]]:
+    '''Picks one of the 24 rotations as a signed permutation matrix.'''
+    while True:
+        axes = rng.sample(range(3), 3)
+        signs = [rng.choice([-1, 1]) for _ in range(3)]
+        matrix = [[signs[row] if col == axes[row] else 0 for col in range(3)] for row in range(3)]
+        det = (
+            matrix[0][0] * (matrix[1][1] * matrix[2][2] - matrix[1][2] * matrix[2][1])
+            - matrix[0][1] * (matrix[1][0] * matrix[2][2] - matrix[1][2] * matrix[2][0])
+            + matrix[0][2] * (matrix[1][0] * matrix[2][1] - matrix[1][1] * matrix[2][0])
+        )
+        if det == 1:
+            return matrix
+
+def generate_day19(rng: Random, scale: int) -> str:
+    '''Generates scanner reports that can all be aligned.'''
+    # Each scanner shares at least 12 beacons with the scanner it was placed next to
+    num_scanners = 30 * scale
+    positions = [(0, 0, 0)]
+    beacons_by_scanner = [set()]
+    for _ in range(num_scanners - 1):
+        parent = rng.randrange(len(positions))
+        offset = [rng.randint(-1200, 1200) for _ in range(3)]
+        offset[rng.randrange(3)] = rng.choice([-1, 1]) * rng.randint(1000, 1200)
+        position = tuple(p + o for p, o in zip(positions[parent], offset))
+        shared = set()
+        while len(shared) < 12:
+            shared.add(tuple(
+                rng.randint(max(p, q) - 1000, min(p, q) + 1000)
+                for p, q in zip(positions[parent], position)
+            ))
+        beacons_by_scanner[parent] |= shared
+        positions.append(position)
+        beacons_by_scanner.append(set(shared))
+    sections = []
+    for idx, (position, beacons) in enumerate(zip(positions, beacons_by_scanner)):
+        while len(beacons) < 26:
+            beacons.add(tuple(p + rng.randint(-1000, 1000) for p in position))
+        rotation = random_rotation(rng)
+        lines = [f'--- scanner {idx} ---']
+        beacons = list(beacons)
+        rng.shuffle(beacons)
+        for beacon in beacons:
+            relative = [b - p for b, p in zip(beacon, position)]
+            rotated = [sum(rotation[row][col] * relative[col] for col in range(3)) for row in range(3)]
+            lines.append(','.join(str(value) for value in rotated))
+        sections.append('\n'.join(lines) + '\n')
+    return '\n'.join(sections)
+
+def generate_day20(rng: Random, scale: int) -> str:
+    '''Generates an image enhancement algorithm and a square image.'''
+    cipher = ''.join(rng.choice('#.') for _ in range(512))
+    side = scale_side(100, scale)
+    image = ''.join(''.join(rng.choice('#.') for _ in range(side)) + '\n' for _ in range(side))
+    return f'{cipher}\n\n{image}'
+
+def generate_day21(rng: Random, scale: int) -> str:
+    '''Generates the starting positions of both players.'''
+    return f'Player 1 starting position: {rng.randint(1, 10)}\nPlayer 2 starting position: {rng.randint(1, 10)}\n'
+
+def generate_cuboid(rng: Random, low: int, high: int, max_size: int) -> str:
+    '''Generates a reboot step region within the given bounds.'''
+    bounds = []
+    for axis in 'xyz':
+        start = rng.randint(low, high - 1)
+        end = min(high, start + rng.randint(1, max_size))
+        bounds.append(f'{axis}={start}..{end}')
+    return ','.join(bounds)
+
+def generate_day22(rng: Random, scale: int) -> str:
+    '''Generates the reboot steps, starting with steps inside the initialization region.'''
+    steps = []
+    for idx in range(420 * scale):
+        state = 'on' if idx < 10 or rng.random() < 0.6 else 'off'
+        if idx < 20:
+            steps.append(f'{state} {generate_cuboid(rng, -50, 50, 50)}\n')
+        else:
+            steps.append(f'{state} {generate_cuboid(rng, -100000, 100000, 40000)}\n')
+    return ''.join(steps)
+
+def generate_day23(rng: Random, scale: int) -> str:
+    '''Generates a folded burrow with the amphipods shuffled.'''
+    amphipods = list('AABBCCDD')
+    rng.shuffle(amphipods)
+    return '\n'.join([
+        '#############',
+        '#...........#',
+        '###' + '#'.join(amphipods[:4]) + '###',
+        '  #' + '#'.join(amphipods[4:]) + '#',
+        '  #########',
+    ])
+
+def generate_day25(rng: Random, scale: int) -> str:
+    '''Generates a map of sea cucumbers.'''
+    height = scale_side(137, scale)
+    width = scale_side(139, scale)
+    return ''.join(''.join(rng.choice('>v..') for _ in range(width)) + '\n' for _ in range(height))
+
+GENERATORS: Dict[str, Generator] = {
+    'day01': Generator(generate_day01),
+    'day02': Generator(generate_day02),
+    'day03': Generator(generate_day03),
+    'day04': Generator(generate_day04),
+    'day05': Generator(generate_day05),
+    'day06': Generator(generate_day06),
+    'day07': Generator(generate_day07),
+    'day08': Generator(generate_day08),
+    'day09': Generator(generate_day09),
+    'day10': Generator(generate_day10),
+    # Random octopuses may never all flash together, so Part 2 is not run
+    'day11': Generator(generate_day11, ['part_1']),
+    'day12': Generator(generate_day12),
+    'day13': Generator(generate_day13),
+    'day14': Generator(generate_day14),
+    'day15': Generator(generate_day15),
+    'day16': Generator(generate_day16),
+    'day17': Generator(generate_day17),
+    'day18': Generator(generate_day18),
+    'day19': Generator(generate_day19),
+    'day20': Generator(generate_day20),
+    'day21': Generator(generate_day21),
+    'day22': Generator(generate_day22),
+    'day23': Generator(generate_day23),
+    'day25': Generator(generate_day25, ['part_1']),
+}
+
+def generate_input(day: str, scale: int, seed: int = 0) -> str:
+    '''Generates an input for the given day at the given scale.'''
+    return GENERATORS[day].generate(Random(f'{day}-{scale}-{seed}'), scale)
@@ -0,0 +1,86 @@
+'''Precomputed neighbour tables for rectangular grids, indexed by flat (row-major) cell index.
+
+A table for a given shape is built once and cached, so flood fills, shortest path searches
+and cellular updates can look up the neighbours of cell i as table[i] instead of building
+lists of coordinate tuples on every call. Tables are np.int32 arrays with one row per cell,
+where neighbours that fall off the edge of a grid without wraparound are NO_NEIGHBOR.
+The columns follow the order of the offsets, so table[:, RIGHT] steps every cell right.
+Grids too large to hold a table for, such as tiled maps, can find the 4-connected
+neighbours of a batch of cells with get_neighbors instead.
+'''
+from __future__ import annotations
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Shape = Tuple[int, int]
+
+NO_NEIGHBOR = -1
+# The 4-connected offsets, in column order
+UP, DOWN, LEFT, RIGHT = range(4)
+OFFSETS_4 = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+# The 8-connected offsets, in reading order
+OFFSETS_8 = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+# The 3x3 window around a cell including the cell itself, in reading order
+OFFSETS_WINDOW = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 0), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+def get_offsets(connectivity: int) -> List[Tuple[int, int]]:
+    '''Returns the neighbour offsets for 4- or 8-connected grids.'''
+    if connectivity == 4:
+        return OFFSETS_4
+    if connectivity == 8:
+        return OFFSETS_8
+    raise ValueError(f'Connectivity must be 4 or 8, not {connectivity}')
+
+def build_table(shape: Shape, offsets: List[Tuple[int, int]], mode: str) -> np.ndarray:
+    '''Builds the neighbour table for the offsets, where mode says what happens at the edges:
+    "drop" marks neighbours off the grid as NO_NEIGHBOR, "wrap" wraps around to the other side
+    and "clamp" uses the nearest cell on the grid instead.'''
+    import numpy as np
+
+    num_rows, num_cols = shape
+    rows, cols = np.indices(shape).reshape(2, -1, 1)
+    row_offsets, col_offsets = np.array(offsets, dtype=np.int64).reshape(-1, 2).T
+    adj_rows = rows + row_offsets
+    adj_cols = cols + col_offsets
+    if mode == 'wrap':
+        table = (adj_rows % num_rows) * num_cols + (adj_cols % num_cols)
+    elif mode == 'clamp':
+        table = np.clip(adj_rows, 0, num_rows - 1) * num_cols + np.clip(adj_cols, 0, num_cols - 1)
+    elif mode == 'drop':
+        table = adj_rows * num_cols + adj_cols
+        table[(adj_rows < 0) | (adj_rows >= num_rows) | (adj_cols < 0) | (adj_cols >= num_cols)] = NO_NEIGHBOR
+    else:
+        raise ValueError(f'Unknown edge mode: {mode}')
+    table = table.astype(np.int32)
+    # Tables are cached and shared, so make sure nobody modifies one
+    table.setflags(write=False)
+    return table
+
+@lru_cache(maxsize=None)
+def get_neighbor_table(shape: Shape, connectivity: int = 4, wrap: bool = False) -> np.ndarray:
+    '''Returns the (cells, connectivity) table of each cell's neighbours, padded with NO_NEIGHBOR
+    at the edges unless the grid wraps around.'''
+    return build_table(tuple(shape), get_offsets(connectivity), 'wrap' if wrap else 'drop')
+
+@lru_cache(maxsize=None)
+def get_window_table(shape: Shape) -> np.ndarray:
+    '''Returns the (cells, 9) table of the 3x3 window around each cell in reading order,
+    using the nearest cell on the grid for any part of the window that falls off the edge.'''
+    return build_table(tuple(shape), OFFSETS_WINDOW, 'clamp')
+
+def get_neighbors(idxs: np.ndarray, shape: Shape) -> np.ndarray:
+    '''Returns the flat indices of every on-grid up, down, left and right neighbour of the cells,
+    worked out from the indices themselves rather than looked up in a table.'''
+    import numpy as np
+
+    num_rows, num_cols = shape
+    rows, cols = np.divmod(idxs, num_cols)
+    return np.concatenate([
+        idxs[rows > 0] - num_cols,
+        idxs[rows < num_rows - 1] + num_cols,
+        idxs[cols > 0] - 1,
+        idxs[cols < num_cols - 1] + 1,
+    ])
@@ -0,0 +1,143 @@
+'''Fast readers for the puzzle inputs, shared by every day's load_input.
+
+Grids are read in bulk through a byte buffer rather than one character at a time,
+memory-mapping files larger than MMAP_THRESHOLD instead of reading them into memory.
+NumPy is only imported by the readers that return arrays, so days that parse their
+input into plain Python objects don't pay for importing it.
+'''
+from __future__ import annotations
+from contextlib import contextmanager
+from errno import ENOENT
+from mmap import ACCESS_READ, mmap
+from os import strerror
+from os.path import exists, getsize
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MMAP_THRESHOLD = 1 << 24
+CHUNK_SIZE = 1 << 22
+NEWLINE = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+ZERO = ord('0')
+
+def check_exists(path: str) -> None:
+    '''Raises a FileNotFoundError if there is no file at the given path.'''
+    if not exists(path):
+        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
+
+@contextmanager
+def open_buffer(path: str) -> Iterator[Union[bytes, mmap]]:
+    '''Opens the file as a read-only byte buffer, memory-mapping it if it is large.'''
+    check_exists(path)
+    with open(path, 'rb') as input_file:
+        if getsize(path) < MMAP_THRESHOLD:
+            yield input_file.read()
+        else:
+            with mmap(input_file.fileno(), 0, access=ACCESS_READ) as buffer:
+                yield buffer
+
+def iter_line_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    '''Reads the file lazily in blocks of about chunk_size bytes, each ending at the end of a line,
+    so that files too large to hold in memory can be processed a block at a time.'''
+    check_exists(path)
+    with open(path, 'rb') as input_file:
+        remainder = b''
+        while block := input_file.read(chunk_size):
+            block = remainder + block
+            line_end = block.rfind(b'\n') + 1
+            remainder = block[line_end:]
+            if line_end > 0:
+                yield block[:line_end]
+        if remainder:
+            yield remainder
+
+def get_line_ranges(path: str, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    '''Splits the file into (start, end) byte ranges of about chunk_size bytes, each made of whole lines,
+    so that separate processes can each read and process one range.'''
+    check_exists(path)
+    size = getsize(path)
+    ranges = []
+    with open(path, 'rb') as input_file:
+        start = 0
+        while start < size:
+            input_file.seek(min(start + chunk_size, size))
+            # Move the end of the range to the end of the line it lands in
+            input_file.readline()
+            end = min(input_file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def read_range(path: str, byte_range: Tuple[int, int]) -> bytes:
+    '''Reads the (start, end) byte range of the file.'''
+    start, end = byte_range
+    with open(path, 'rb') as input_file:
+        input_file.seek(start)
+        return input_file.read(end - start)
+
+def read_text(path: str) -> str:
+    '''Reads the whole file as a string.'''
+    check_exists(path)
+    with open(path, 'r') as input_file:
+        return input_file.read()
+
+def read_lines(path: str, strip: bool = True) -> List[str]:
+    '''Reads the file as a list of lines, without line endings.
+    Surrounding whitespace is also removed from each line unless strip is False.'''
+    lines = read_text(path).splitlines()
+    if strip:
+        return [line.strip() for line in lines]
+    return lines
+
+def read_ints(path: str, sep: str = ',') -> List[int]:
+    '''Reads the integers separated by the given separator (or any whitespace if sep is whitespace).'''
+    text = read_text(path).strip()
+    if not text:
+        return []
+    return list(map(int, text.split(None if sep.isspace() else sep)))
+
+def read_int_array(path: str, sep: str = ',') -> np.ndarray:
+    '''Reads the integers separated by the given separator (or any whitespace if sep is whitespace)
+    as an np.int64 array.'''
+    import numpy as np
+
+    # np.fromstring parses bytes directly, but can't take a memory-mapped buffer
+    check_exists(path)
+    with open(path, 'rb') as input_file:
+        return np.fromstring(input_file.read(), dtype=np.int64, sep=sep)
+
+def read_char_grid(path: str) -> np.ndarray:
+    '''Reads a rectangular grid of characters as a 2D np.uint8 array of character codes.'''
+    import numpy as np
+
+    with open_buffer(path) as buffer:
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        line_end = buffer.find(b'\n')
+        if line_end == -1:
+            line_end = len(data)
+        width = line_end
+        if width > 0 and data[width - 1] == CARRIAGE_RETURN:
+            width -= 1
+        stride = line_end + 1
+
+        # Ignore any trailing line endings, then check the rows all have the same width
+        length = len(data)
+        while length > 0 and data[length - 1] in (NEWLINE, CARRIAGE_RETURN):
+            length -= 1
+        num_rows = (length + stride - width) // stride
+        if length + stride - width != num_rows * stride:
+            raise ValueError(f'Rows in {path} are not all {width} characters wide')
+
+        grid = np.empty(num_rows * stride, dtype=np.uint8)
+        grid[:length] = data[:length]
+        # Release the view so a memory-mapped buffer can be closed
+        del data
+    return np.ascontiguousarray(grid.reshape(num_rows, stride)[:, :width])
+
+def read_digit_grid(path: str) -> np.ndarray:
+    '''Reads a rectangular grid of digits as a 2D np.uint8 array.'''
+    grid = read_char_grid(path)
+    grid -= ZERO
+    return grid
@@ -0,0 +1,251 @@
+'''Profiles a single day, reporting where the time and memory go.
+
+The day is run under cProfile with call counters wrapped around its known hot functions.
+Optionally, a second run samples the call stack to write a flamegraph-compatible folded
+stack dump (one "frame;frame;frame count" line per distinct stack, as read by flamegraph.pl
+or speedscope), and a third run traces allocations to report the peak memory of each phase.
+Stack sampling uses a profiling timer signal, so it is only available on Unix.
+
+Usage: python -m aoc.profiling DAY [--input PATH | --scale N] [--count MODULE:FUNCTION ...] [--flamegraph PATH] [--memory]
+'''
+from argparse import ArgumentParser
+from collections import Counter
+from contextlib import contextmanager, redirect_stdout
+from cProfile import Profile
+from dataclasses import dataclass
+from functools import wraps
+from io import StringIO
+from os.path import basename, join
+from pstats import Stats
+import signal
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import tracemalloc
+from types import FrameType
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional
+
+from aoc.generators import GENERATORS, generate_input
+from aoc.runner import PARTS, format_time, get_input_path, load_day, normalize_day
+
+# Functions worth counting calls to, as "module:qualified name", where "main" is the day's main module
+HOT_FUNCTIONS = {
+    'day12': ['cave:CaveGraph.count_paths_from'],
+    'day14': ['polymer:PolymerModel.step', 'polymer:PairPowers.get_power'],
+    'day18': ['main:reduce'],
+    'day19': ['sensors:Scanner.try_align'],
+    'day20': ['main:enhance_image'],
+    'day23': ['burrow:Burrow.get_valid_next_coords'],
+}
+DEFAULT_INTERVAL = 0.001
+
+@dataclass
+class CallCounter:
+    '''The number of calls to a function and the time spent in its outermost calls.'''
+    name: str
+    calls: int = 0
+    time: float = 0
+    depth: int = 0
+
+    def wrap(self, func: Callable) -> Callable:
+        '''Wraps the function so that calls to it are counted and timed.'''
+        @wraps(func)
+        def counted(*args, **kwargs):
+            self.calls += 1
+            if self.depth > 0:
+                return func(*args, **kwargs)
+            self.depth += 1
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.time += perf_counter() - start
+                self.depth -= 1
+        return counted
+
+@contextmanager
+def count_calls(day: str, targets: List[str]) -> Iterator[List[CallCounter]]:
+    '''Temporarily replaces each target function with a counting wrapper, yielding the counters.'''
+    main_module = load_day(day)
+    counters = []
+    patches = []
+    for target in targets:
+        module_name, qualname = target.split(':')
+        module = main_module if module_name == 'main' else sys.modules.get(module_name)
+        if module is None:
+            raise ValueError(f'{module_name} is not imported by {day}')
+        *owner_names, attr = qualname.split('.')
+        owner = module
+        for owner_name in owner_names:
+            owner = getattr(owner, owner_name)
+        func = getattr(owner, attr)
+        counter = CallCounter(target)
+        wrapped = counter.wrap(func)
+        patches.append((owner, attr, func))
+        setattr(owner, attr, wrapped)
+        # Functions imported by name into the main module need patching there too
+        if owner is module and module is not main_module and getattr(main_module, attr, None) is func:
+            patches.append((main_module, attr, func))
+            setattr(main_module, attr, wrapped)
+        counters.append(counter)
+    try:
+        yield counters
+    finally:
+        for owner, attr, func in reversed(patches):
+            setattr(owner, attr, func)
+
+class StackSampler:
+    '''Samples the Python call stack on a CPU time interval, counting each distinct stack.'''
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        self.interval = interval
+        self.stacks = Counter()
+
+    def sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        '''Records the stack of the interrupted frame, outermost frame first, stopping at run_phases.'''
+        names = []
+        while frame is not None and frame.f_code is not run_phases.__code__:
+            code = frame.f_code
+            names.append(f'{code.co_name} ({basename(code.co_filename)}:{code.co_firstlineno})')
+            frame = frame.f_back
+        if names:
+            self.stacks[';'.join(reversed(names))] += 1
+
+    @contextmanager
+    def running(self) -> Iterator[None]:
+        '''Samples the stack for the duration of the context.'''
+        previous_handler = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous_handler)
+
+    def write_folded(self, path: str) -> None:
+        '''Writes the sampled stacks in the folded format read by flamegraph tools.'''
+        with open(path, 'w') as folded_file:
+            for stack, count in self.stacks.most_common():
+                folded_file.write(f'{stack} {count}\n')
+
+def run_phases(day: str, input_path: str, parts: List[str], wrap_phase: Callable[[str], ContextManager]) -> Dict[str, str]:
+    '''Parses the input and runs each part, entering the context from wrap_phase around each phase.
+    Returns the answers. Anything the solution prints is discarded.'''
+    module = load_day(day)
+    answers = {}
+    with redirect_stdout(StringIO()):
+        with wrap_phase('parse'):
+            data = module.load_input(input_path)
+        for part in parts:
+            part_func = getattr(module, part, None)
+            if part_func is None:
+                continue
+            with wrap_phase(part):
+                answers[part] = str(part_func(data))
+    return answers
+
+def profile_calls(day: str, input_path: str, parts: List[str], targets: List[str], sort: str, limit: int) -> None:
+    '''Runs the day under cProfile with counters on the target functions, printing both reports.'''
+    profile = Profile()
+    timings = {}
+
+    @contextmanager
+    def profile_phase(phase: str) -> Iterator[None]:
+        start = perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            timings[phase] = perf_counter() - start
+
+    with count_calls(day, targets) as counters:
+        answers = run_phases(day, input_path, parts, profile_phase)
+
+    print(f'--- {day} ---')
+    for phase, timing in timings.items():
+        answer = answers.get(phase, '').replace('\n', ' / ')
+        print(f'{phase:<8} {format_time(timing):>10}  {answer}')
+    print('')
+    if counters:
+        print(f'{"Hot function":<50} {"Calls":>12} {"Time":>10}')
+        for counter in counters:
+            print(f'{counter.name:<50} {counter.calls:>12} {format_time(counter.time):>10}')
+        print('')
+    Stats(profile, stream=sys.stdout).strip_dirs().sort_stats(sort).print_stats(limit)
+
+def sample_stacks(day: str, input_path: str, parts: List[str], output_path: str, interval: float) -> None:
+    '''Runs the day while sampling its call stack, writing the folded stacks to the output path.'''
+    sampler = StackSampler(interval)
+
+    @contextmanager
+    def sample_phase(phase: str) -> Iterator[None]:
+        with sampler.running():
+            yield
+
+    run_phases(day, input_path, parts, sample_phase)
+    sampler.write_folded(output_path)
+    print(f'Wrote {sum(sampler.stacks.values())} samples of {len(sampler.stacks)} distinct stacks to {output_path}')
+
+def trace_memory(day: str, input_path: str, parts: List[str], limit: int) -> None:
+    '''Runs the day while tracing allocations, printing the peak memory of each phase
+    and the lines holding the most memory once the day has finished.'''
+    peaks = {}
+
+    @contextmanager
+    def trace_phase(phase: str) -> Iterator[None]:
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            peaks[phase] = tracemalloc.get_traced_memory()[1]
+
+    tracemalloc.start()
+    try:
+        run_phases(day, input_path, parts, trace_phase)
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    print(f'{"Phase":<8} {"Peak mem":>12}')
+    for phase, peak in peaks.items():
+        print(f'{phase:<8} {peak / (1 << 20):>8.1f} MiB')
+    print('')
+    print('Memory still held by line:')
+    for stat in snapshot.statistics('lineno')[:limit]:
+        print(f'  {stat}')
+
+def main():
+    parser = ArgumentParser(description='Profile a single day.')
+    parser.add_argument('day', help='day to profile (e.g. 7 or day07)')
+    parser.add_argument('--input', default=None, help='input file to use instead of the puzzle input')
+    parser.add_argument('--scale', type=int, default=None, help='use a generated input of this scale instead of the puzzle input')
+    parser.add_argument('--parts', nargs='+', default=PARTS, choices=PARTS, help='parts to run')
+    parser.add_argument('--count', nargs='+', default=[], metavar='MODULE:FUNCTION', help='extra functions to count calls to')
+    parser.add_argument('--sort', default='cumulative', help='pstats sort key for the function report')
+    parser.add_argument('--limit', type=int, default=25, help='number of rows in the function report')
+    parser.add_argument('--flamegraph', default=None, metavar='PATH', help='also sample the stack and write folded stacks here')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help='seconds of CPU time between stack samples')
+    parser.add_argument('--memory', action='store_true', help='also trace the peak memory of each phase')
+    args = parser.parse_args()
+
+    day = normalize_day(args.day)
+    targets = HOT_FUNCTIONS.get(day, []) + args.count
+    with TemporaryDirectory() as temp_dir:
+        input_path = args.input
+        if args.scale is not None:
+            if day not in GENERATORS:
+                parser.error(f'{day} has no input generator')
+            input_path = join(temp_dir, f'{day}_x{args.scale}.txt')
+            with open(input_path, 'w') as input_file:
+                input_file.write(generate_input(day, args.scale))
+        elif input_path is None:
+            input_path = get_input_path(day)
+
+        profile_calls(day, input_path, args.parts, targets, args.sort, args.limit)
+        if args.flamegraph is not None:
+            sample_stacks(day, input_path, args.parts, args.flamegraph, args.interval)
+        if args.memory:
+            trace_memory(day, input_path, args.parts, args.limit)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+'''Checks the benchmark workloads for performance regressions against a stored baseline.
+
+Each day in the baseline is benchmarked again with the same scales, seed and timeout. A phase regresses
+when its median time grows past the time tolerance (and by more than MIN_TIME_INCREASE, to
+ignore noise on very fast phases), and a day regresses when its peak memory grows past the
+memory tolerance or when it no longer finishes within the baseline's timeout. Rows that
+didn't finish when the baseline was recorded are reported on every run, and fail once they
+do finish, since a number that moved has to be recorded. Any regression makes the command
+exit with 1. Pass --update after an intentional change to record the new measurements as the
+baseline, in the same commit as the change. --update refuses to store a row that failed or
+whose peak memory wasn't measured in time.
+
+Usage: python -m aoc.regression [DAY ...] [--update] [--time-tolerance 0.5] [--memory-tolerance 0.25]
+'''
+from argparse import ArgumentParser
+from dataclasses import asdict
+import json
+from os.path import abspath, dirname, exists, join
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from aoc.bench import BenchResult, print_header, run_benchmarks
+from aoc.generators import GENERATORS
+from aoc.runner import PHASES, format_time, normalize_day
+
+BASELINE_PATH = join(dirname(abspath(__file__)), 'baseline.json')
+BASELINE_SCALES = [1, 10]
+MIN_TIME_INCREASE = 0.01
+BASELINE_TIMEOUT = 3600
+# Larger scales are skipped once a day times out, so they didn't finish either
+UNFINISHED = ['timeout', 'skipped']
+
+def load_baseline(path: str) -> Tuple[Dict, List[BenchResult]]:
+    '''Loads the benchmark settings and results from a baseline file.'''
+    with open(path, 'r') as baseline_file:
+        baseline = json.load(baseline_file)
+    results = [BenchResult(**result) for result in baseline.pop('results')]
+    return baseline, results
+
+def save_baseline(path: str, settings: Dict, results: List[BenchResult]) -> None:
+    '''Saves the benchmark settings and results as a baseline file.'''
+    with open(path, 'w') as baseline_file:
+        json.dump({**settings, 'results': [asdict(result) for result in results]}, baseline_file, indent=2)
+        baseline_file.write('\n')
+
+def find_regressions(expected: BenchResult, actual: BenchResult, time_tolerance: float, memory_tolerance: float) -> List[str]:
+    '''Compares a new benchmark result with its baseline, describing each regression found.'''
+    if expected.status in UNFINISHED and actual.status in UNFINISHED:
+        return []
+    if actual.status != 'ok':
+        return [f'{actual.status} (was {expected.status})']
+    if expected.status != 'ok':
+        return [f'finished but has no baseline measurement (was {expected.status}), record it with --update']
+    regressions = []
+    for phase in PHASES:
+        if phase not in expected.timings or phase not in actual.timings:
+            continue
+        before, after = expected.timings[phase], actual.timings[phase]
+        if after > before * (1 + time_tolerance) and after - before > MIN_TIME_INCREASE:
+            regressions.append(f'{phase} took {format_time(after)} (was {format_time(before)})')
+    if expected.peak_memory_kb is not None:
+        if actual.peak_memory_kb is None:
+            regressions.append(f'peak memory not measured in time (was {expected.peak_memory_kb} KiB)')
+        elif actual.peak_memory_kb > expected.peak_memory_kb * (1 + memory_tolerance):
+            regressions.append(f'peak memory {actual.peak_memory_kb} KiB (was {expected.peak_memory_kb} KiB)')
+    return regressions
+
+def check_regressions(baseline: List[BenchResult], results: List[BenchResult], time_tolerance: float, memory_tolerance: float, timeout: float) -> bool:
+    '''Prints every regression of the results against the baseline, returning whether there were none.'''
+    expected_results = {(result.day, result.scale): result for result in baseline}
+    passed = True
+    print('')
+    for actual in results:
+        expected = expected_results.get((actual.day, actual.scale))
+        if expected is None:
+            continue
+        if expected.status in UNFINISHED and actual.status in UNFINISHED:
+            print(f'UNFINISHED {actual.day} at {actual.scale}x: still no measurement within {timeout:g} s')
+        for regression in find_regressions(expected, actual, time_tolerance, memory_tolerance):
+            print(f'REGRESSION {actual.day} at {actual.scale}x: {regression}')
+            passed = False
+    if passed:
+        print('No regressions against the baseline.')
+    return passed
+
+def main():
+    parser = ArgumentParser(description='Check the benchmarks for regressions against a stored baseline.')
+    parser.add_argument('days', nargs='*', help='days to check (e.g. 7 or day07), defaults to every day in the baseline')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline file to compare against')
+    parser.add_argument('--update', action='store_true', help='record the results as the new baseline instead of comparing')
+    parser.add_argument('--scales', type=int, nargs='+', default=None, help='input sizes to record when updating the baseline')
+    parser.add_argument('--repeat', type=int, default=None, help='number of runs to take the median of')
+    parser.add_argument('--timeout', type=float, default=None, help="seconds to allow for each measurement, defaults to the baseline's")
+    parser.add_argument('--time-tolerance', type=float, default=0.5, help='allowed relative increase in the median time of a phase')
+    parser.add_argument('--memory-tolerance', type=float, default=0.25, help='allowed relative increase in peak memory')
+    args = parser.parse_args()
+
+    days = [normalize_day(day) for day in args.days]
+    for day in days:
+        if day not in GENERATORS:
+            parser.error(f'{day} has no input generator')
+
+    baseline: Optional[List[BenchResult]] = None
+    settings = {'scales': BASELINE_SCALES, 'repeat': 3, 'seed': 0, 'timeout': BASELINE_TIMEOUT}
+    if exists(args.baseline):
+        settings, baseline = load_baseline(args.baseline)
+    elif not args.update:
+        parser.error(f'No baseline at {args.baseline}, create one with --update')
+    if args.scales is not None:
+        settings['scales'] = args.scales
+    if args.repeat is not None:
+        settings['repeat'] = args.repeat
+    # A shorter timeout than the baseline's would turn slow rows into false regressions
+    settings.setdefault('timeout', BASELINE_TIMEOUT)
+    if args.timeout is not None:
+        settings['timeout'] = args.timeout
+    if not days:
+        days = list(GENERATORS) if args.update or baseline is None else sorted({result.day for result in baseline})
+
+    print_header()
+    results = run_benchmarks(days, settings['scales'], settings['repeat'], settings['timeout'], settings['seed'])
+
+    if args.update:
+        unmeasured = [result for result in results if result.status not in ['ok'] + UNFINISHED or (result.status == 'ok' and result.peak_memory_kb is None)]
+        if unmeasured:
+            print('')
+            for result in unmeasured:
+                print(f'NOT MEASURED {result.day} at {result.scale}x: {result.status if result.status != "ok" else "no peak memory"}')
+            print(f'The baseline in {args.baseline} was not updated')
+            sys.exit(1)
+        # Keep the baseline for any days that weren't run this time
+        kept = [result for result in baseline or [] if result.day not in days]
+        results = sorted(kept + results, key=lambda result: (result.day, result.scale))
+        save_baseline(args.baseline, settings, results)
+        print(f'\nUpdated the baseline in {args.baseline}')
+    elif not check_regressions(baseline, results, args.time_tolerance, args.memory_tolerance, settings['timeout']):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
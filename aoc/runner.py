@@ -0,0 +1,161 @@
+'''Runs the solutions for every day across a pool of processes, timing each phase.
+
+Usage: python -m aoc.runner [DAY ...] [--workers N] [--cache]
+'''
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from importlib.util import module_from_spec, spec_from_file_location
+from io import StringIO
+from os import cpu_count, listdir
+from os.path import abspath, dirname, exists, join
+import re
+import sys
+from time import perf_counter
+from traceback import format_exception_only
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aoc.cache import cached_load
+
+REPO_ROOT = dirname(dirname(abspath(__file__)))
+PARTS = ['part_1', 'part_2']
+PHASES = ['parse'] + PARTS
+
+@dataclass
+class DayResult:
+    '''The answers and per-phase wall times (in seconds) from running a single day.'''
+    day: str
+    answers: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def total_time(self) -> float:
+        '''Computes the total wall time across all phases.'''
+        return sum(self.timings.values())
+
+def get_days() -> List[str]:
+    '''Returns the names of all the day directories containing a solution, in order.'''
+    days = []
+    for name in sorted(listdir(REPO_ROOT)):
+        if re.fullmatch(r'day\d\d', name) and exists(join(REPO_ROOT, name, 'main.py')):
+            days.append(name)
+    return days
+
+def normalize_day(day: str) -> str:
+    '''Converts a day given as "7", "07" or "day07" into its directory name.'''
+    match = re.fullmatch(r'(?:day)?(\d{1,2})', day)
+    if match is None:
+        raise ValueError(f'Not a valid day: {day}')
+    return f'day{int(match.group(1)):02}'
+
+def get_input_path(day: str) -> str:
+    '''Returns the path to the puzzle input for the given day.'''
+    return join(REPO_ROOT, day, 'puzzle_input.txt')
+
+def load_day(day: str) -> ModuleType:
+    '''Imports the main module for the given day, making its sibling modules importable.'''
+    module_name = f'{day}_main'
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    day_dir = join(REPO_ROOT, day)
+    if day_dir not in sys.path:
+        sys.path.insert(0, day_dir)
+    spec = spec_from_file_location(module_name, join(day_dir, 'main.py'))
+    module = module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def time_call(func: Callable, *args: Any) -> Tuple[Any, float]:
+    '''Calls the function, returning its result and the wall time it took.'''
+    start = perf_counter()
+    result = func(*args)
+    return result, perf_counter() - start
+
+def run_day(day: str, input_path: Optional[str] = None, parts: List[str] = PARTS, use_cache: bool = False) -> DayResult:
+    '''Parses the input and runs each of the given parts for the given day, timing each phase.
+    If use_cache is set, the parsed input is reused from the on-disk cache when possible.
+    Anything the solution prints is discarded.'''
+    result = DayResult(day)
+    if input_path is None:
+        input_path = get_input_path(day)
+    try:
+        with redirect_stdout(StringIO()):
+            module = load_day(day)
+            if use_cache:
+                data, result.timings['parse'] = time_call(cached_load, module.load_input, input_path)
+            else:
+                data, result.timings['parse'] = time_call(module.load_input, input_path)
+            for part in parts:
+                part_func = getattr(module, part, None)
+                if part_func is None:
+                    continue
+                answer, result.timings[part] = time_call(part_func, data)
+                result.answers[part] = str(answer)
+    except Exception as error:
+        result.error = format_exception_only(type(error), error)[-1].strip()
+    return result
+
+def run_days(days: List[str], workers: Optional[int] = None, use_cache: bool = False) -> List[DayResult]:
+    '''Runs the given days across a pool of worker processes, returning the results in day order.'''
+    if workers is None:
+        workers = min(len(days), cpu_count() or 1)
+    if workers <= 1:
+        return [run_day(day, use_cache=use_cache) for day in days]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_day, day, use_cache=use_cache) for day in days]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return sorted(results, key=lambda result: result.day)
+
+def format_time(seconds: Optional[float]) -> str:
+    '''Formats a wall time for display in the results table.'''
+    if seconds is None:
+        return '-'
+    if seconds < 1:
+        return f'{seconds * 1000:.1f} ms'
+    return f'{seconds:.2f} s'
+
+def format_answer(answer: Optional[str]) -> str:
+    '''Formats an answer for display in the results table.'''
+    if answer is None:
+        return '-'
+    if '\n' in answer:
+        return f'({answer.count(chr(10)) + 1} lines)'
+    return answer
+
+def print_results(results: List[DayResult], wall_time: float) -> None:
+    '''Prints a table of the answers and per-phase timings for every day.'''
+    print(f'{"Day":<6} {"Parse":>10} {"Part 1":>10} {"Part 2":>10} {"Total":>10}  Answers')
+    for result in results:
+        timings = [format_time(result.timings.get(phase)) for phase in PHASES]
+        row = f'{result.day:<6} ' + ' '.join(f'{timing:>10}' for timing in timings)
+        row += f' {format_time(result.total_time()):>10}  '
+        if result.error is not None:
+            row += f'ERROR: {result.error}'
+        else:
+            row += ', '.join(format_answer(result.answers.get(part)) for part in PARTS if part in result.answers)
+        print(row)
+    print('')
+    print(f'Sum of day times: {format_time(sum(result.total_time() for result in results))}')
+    print(f'Wall time: {format_time(wall_time)}')
+
+def main():
+    parser = ArgumentParser(description='Run the solutions for every day in parallel.')
+    parser.add_argument('days', nargs='*', help='days to run (e.g. 7 or day07), defaults to all days')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes (1 runs serially)')
+    parser.add_argument('--cache', action='store_true', help='reuse parsed inputs from the on-disk cache')
+    args = parser.parse_args()
+
+    days = [normalize_day(day) for day in args.days] if args.days else get_days()
+    start = perf_counter()
+    results = run_days(days, args.workers, args.cache)
+    print_results(results, perf_counter() - start)
+    if any(result.error is not None for result in results):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
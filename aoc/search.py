@@ -0,0 +1,157 @@
+'''Shortest path searches over integer-encoded states.
+
+States are plain ints (a flat grid index, or a whole puzzle state packed into an int), so
+costs and parents live in dicts keyed by small hashable values instead of on node objects.
+The caller supplies get_neighbors, which returns each (next state, step cost) pair, and
+is_goal. Entries in the queue are never updated in place; instead a state is pushed again
+whenever a cheaper path to it is found, and any stale entries are skipped when popped.
+
+dijkstra works for any non-negative costs and a_star additionally takes a consistent
+heuristic. bucket_search (Dial's algorithm) replaces the heap with a ring of buckets, which
+is faster when every step costs a small integer, and expands a whole bucket of states at
+once with NumPy. Its states are the numbers below num_states, so their costs live in an
+int32 array instead, and its get_neighbors works on arrays of states.
+'''
+from __future__ import annotations
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+State = int
+GetNeighbors = Callable[[State], Iterable[Tuple[State, int]]]
+# Takes an array of states, returning the arrays of next states and step costs of all their neighbours
+GetNeighborArrays = Callable[['np.ndarray'], Tuple['np.ndarray', 'np.ndarray']]
+IsGoal = Callable[[State], bool]
+Heuristic = Callable[[State], int]
+
+UNREACHED = 2 ** 31 - 1
+
+@dataclass
+class SearchStats:
+    '''Counts of the work done by a search.'''
+    expansions: int = 0
+    pushes: int = 0
+    pops: int = 0
+    stale_pops: int = 0
+
+@dataclass
+class SearchResult:
+    '''The outcome of a search. The cost and goal are None if no goal was reachable.
+    Parents are only recorded if the search was asked to track them.'''
+    cost: Optional[int]
+    goal: Optional[State]
+    costs: Dict[State, int]
+    parents: Dict[State, State] = field(default_factory=dict)
+    stats: SearchStats = field(default_factory=SearchStats)
+
+    def get_path(self) -> List[State]:
+        '''Returns the states from the start to the goal, which requires tracked parents.'''
+        if self.goal is None:
+            return []
+        path = [self.goal]
+        while path[-1] in self.parents:
+            path.append(self.parents[path[-1]])
+        return path[::-1]
+
+@dataclass
+class BucketSearchResult:
+    '''The outcome of a bucket_search. The cost is None if no goal was given or it was unreachable.
+    Costs are the int32 cheapest costs found by state, with UNREACHED for states never reached.'''
+    cost: Optional[int]
+    costs: np.ndarray
+    stats: SearchStats = field(default_factory=SearchStats)
+
+def a_star(start: State, is_goal: IsGoal, get_neighbors: GetNeighbors, heuristic: Heuristic, track_parents: bool = False) -> SearchResult:
+    '''Finds the cheapest path from the start to a goal state, expanding states in order of
+    cost so far plus the heuristic's estimate of the remaining cost. The heuristic must never
+    overestimate, and should be consistent so that no state is expanded twice.'''
+    stats = SearchStats()
+    costs = {start: 0}
+    parents = {}
+    queue = [(heuristic(start), 0, start)]
+    stats.pushes += 1
+    while len(queue) > 0:
+        _, cost, state = heappop(queue)
+        stats.pops += 1
+        if cost > costs[state]:
+            stats.stale_pops += 1
+            continue
+        if is_goal(state):
+            return SearchResult(cost, state, costs, parents, stats)
+        stats.expansions += 1
+        for next_state, step_cost in get_neighbors(state):
+            next_cost = cost + step_cost
+            if next_cost < costs.get(next_state, next_cost + 1):
+                costs[next_state] = next_cost
+                if track_parents:
+                    parents[next_state] = state
+                heappush(queue, (next_cost + heuristic(next_state), next_cost, next_state))
+                stats.pushes += 1
+    return SearchResult(None, None, costs, parents, stats)
+
+def dijkstra(start: State, is_goal: IsGoal, get_neighbors: GetNeighbors, track_parents: bool = False) -> SearchResult:
+    '''Finds the cheapest path from the start to a goal state, expanding states in order of cost so far.'''
+    return a_star(start, is_goal, get_neighbors, lambda state: 0, track_parents)
+
+def bucket_search(start: State, num_states: int, get_neighbors: GetNeighborArrays, max_step_cost: int, goal: Optional[State] = None) -> BucketSearchResult:
+    '''Finds the cheapest cost of reaching every state from the start with Dial's algorithm,
+    stopping early once the goal, if there is one, is settled. The queue is a ring of
+    max_step_cost + 1 buckets, and the bucket for cost d holds every state reached with that
+    cost. A whole bucket is expanded at once: get_neighbors takes an array of states and returns
+    arrays of next states and step costs, and every step must cost an integer from 0 to
+    max_step_cost. A state is settled when its bucket is popped, so entries whose cost has since
+    been lowered are skipped then, as are repeats of the same state. A step of cost 0 puts states
+    back into the bucket being popped, so it is popped until it stays empty.'''
+    import numpy as np
+
+    stats = SearchStats()
+    costs = np.full(num_states, UNREACHED, dtype=np.int32)
+    costs[start] = 0
+    num_buckets = max_step_cost + 1
+    buckets: List[List[np.ndarray]] = [[] for _ in range(num_buckets)]
+    buckets[0].append(np.array([start], dtype=np.int64))
+    stats.pushes += 1
+    num_queued = 1
+    cost = 0
+    while num_queued > 0:
+        bucket = buckets[cost % num_buckets]
+        while len(bucket) > 0:
+            states = np.concatenate(bucket)
+            bucket.clear()
+            num_queued -= len(states)
+            stats.pops += len(states)
+            if goal is not None and costs[goal] == cost:
+                return BucketSearchResult(cost, costs, stats)
+            num_popped = len(states)
+            states = states[costs[states] == cost]
+            if len(states) == 0:
+                stats.stale_pops += num_popped
+                continue
+            states.sort()
+            states = states[np.concatenate([[True], states[1:] != states[:-1]])]
+            stats.stale_pops += num_popped - len(states)
+            stats.expansions += len(states)
+
+            next_states, step_costs = get_neighbors(states)
+            if len(step_costs) > 0 and not 0 <= step_costs.min() <= step_costs.max() <= max_step_cost:
+                raise ValueError(f'Step costs must be from 0 to {max_step_cost}')
+            next_costs = cost + step_costs.astype(np.int32)
+            improved = next_costs < costs[next_states]
+            next_states = next_states[improved]
+            next_costs = next_costs[improved]
+            np.minimum.at(costs, next_states, next_costs)
+            # Only queue the cheapest way found to each state
+            best = next_costs == costs[next_states]
+            next_states = next_states[best]
+            next_costs = next_costs[best]
+            for step_cost in range(num_buckets):
+                queued = next_states[next_costs == cost + step_cost]
+                if len(queued) > 0:
+                    buckets[(cost + step_cost) % num_buckets].append(queued)
+                    num_queued += len(queued)
+                    stats.pushes += len(queued)
+        cost += 1
+    return BucketSearchResult(None, costs, stats)
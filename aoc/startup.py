@@ -0,0 +1,81 @@
+'''Measures how long each day takes to start, and whether starting it imports NumPy.
+
+Each day's main module is imported in a fresh interpreter, the same way python -m aoc
+would, and the median wall time of the whole process is compared with a budget.
+The time for an interpreter that imports nothing is shown for reference.
+
+Usage: python -m aoc.startup [DAY ...] [--repeat N] [--budget SECONDS]
+'''
+from argparse import ArgumentParser
+from dataclasses import dataclass
+import json
+from os.path import join
+from statistics import median
+import subprocess
+import sys
+from time import perf_counter
+from typing import List, Tuple
+
+from aoc.runner import REPO_ROOT, format_time, get_days, normalize_day
+
+DEFAULT_BUDGET = 0.05
+# Imports the day's main module without running it, then reports on what it imported
+IMPORT_SCRIPT = '''
+import importlib.util, json, sys, time
+start = time.perf_counter()
+sys.path[:0] = [sys.argv[1], sys.argv[2]]
+spec = importlib.util.spec_from_file_location('main', sys.argv[3])
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+print(json.dumps({'import_time': time.perf_counter() - start, 'numpy': 'numpy' in sys.modules}))
+'''
+
+@dataclass
+class StartupResult:
+    '''The median wall time of a process that only imports the day, and the median time spent importing it.'''
+    day: str
+    process_time: float
+    import_time: float
+    imports_numpy: bool
+
+def time_process(args: List[str]) -> Tuple[float, str]:
+    '''Runs the command, returning its wall time along with anything it printed.'''
+    start = perf_counter()
+    completed = subprocess.run(args, capture_output=True, text=True, check=True)
+    return perf_counter() - start, completed.stdout
+
+def measure_startup(day: str, repeat: int) -> StartupResult:
+    '''Imports the day in a fresh interpreter the given number of times, taking the median times.'''
+    day_dir = join(REPO_ROOT, day)
+    process_times = []
+    import_times = []
+    for _ in range(repeat):
+        process_time, output = time_process([sys.executable, '-c', IMPORT_SCRIPT, REPO_ROOT, day_dir, join(day_dir, 'main.py')])
+        report = json.loads(output)
+        process_times.append(process_time)
+        import_times.append(report['import_time'])
+    return StartupResult(day, median(process_times), median(import_times), report['numpy'])
+
+def main():
+    parser = ArgumentParser(description="Measure how long each day's main module takes to start.")
+    parser.add_argument('days', nargs='*', help='days to measure (e.g. 7 or day07), defaults to all days')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs to take the median of')
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET, help='seconds each day may take to start')
+    args = parser.parse_args()
+
+    days = [normalize_day(day) for day in args.days] if args.days else get_days()
+    interpreter_time = median(time_process([sys.executable, '-c', 'pass'])[0] for _ in range(args.repeat))
+    print(f'Interpreter alone: {format_time(interpreter_time)}')
+    print('')
+    print(f'{"Day":<6} {"Startup":>10} {"Import":>10}  {"NumPy":<6} Budget')
+    num_over_budget = 0
+    for day in days:
+        result = measure_startup(day, args.repeat)
+        over_budget = result.process_time > args.budget
+        num_over_budget += over_budget
+        print(f'{day:<6} {format_time(result.process_time):>10} {format_time(result.import_time):>10}  '
+              f'{"yes" if result.imports_numpy else "no":<6} {"OVER" if over_budget else "ok"}', flush=True)
+    print('')
+    print(f'{num_over_budget} of {len(days)} days took longer than {format_time(args.budget)} to start.')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+'''Makes the aoc package importable from the tests in each day's directory.'''
@@ -1,36 +1,76 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
-from typing import List
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+
+from aoc.loader import CHUNK_SIZE, iter_line_chunks, read_ints
 
 def load_input(path: str) -> List[int]:
     '''Loads the input and returns it as a list of integers.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        str_data = input_file.readlines()
-        int_data = [int(line.strip()) for line in str_data]
-        return int_data
+    return read_ints(path, '\n')
+
+def iter_readings(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[int]:
+    '''Lazily reads the depths from the file, a chunk at a time.'''
+    for chunk in iter_line_chunks(path, chunk_size):
+        yield from map(int, chunk.split())
 
 def count_increases(data: List[int], span: int = 1) -> int:
-    '''Counts the number of times a value in the data is greater than the preceding value.'''
+    '''Counts the number of times a value in the data is greater than the value span places before it.
+    A sliding window sum over span values increases exactly when this happens.'''
     num_increases = 0
-    for first, second in zip(data[:-span], data[span:]):
+    for first, second in zip(data, islice(data, span, None)):
         if second > first:
             num_increases += 1
     return num_increases
 
+def count_increases_streaming(readings: Iterable[int], spans: List[int]) -> Dict[int, int]:
+    '''Counts the increases for each span in a single pass over the readings,
+    keeping only a ring buffer of the last max(spans) readings in memory.'''
+    max_span = max(spans)
+    ring = [0] * max_span
+    num_increases = {span: 0 for span in spans}
+    for i, reading in enumerate(readings):
+        for span in spans:
+            if i >= span and reading > ring[(i - span) % max_span]:
+                num_increases[span] += 1
+        ring[i % max_span] = reading
+    return num_increases
+
+def count_increases_chunked(path: str, spans: List[int], chunk_size: int = CHUNK_SIZE) -> Dict[int, int]:
+    '''Counts the increases for each span like count_increases_streaming, but parses and compares
+    a whole chunk of readings at a time with NumPy, carrying the last max(spans) readings over.'''
+    import numpy as np
+
+    max_span = max(spans)
+    tail = np.empty(0, dtype=np.int64)
+    num_increases = {span: 0 for span in spans}
+    for chunk in iter_line_chunks(path, chunk_size):
+        readings = np.concatenate((tail, np.fromstring(chunk, dtype=np.int64, sep=' ')))
+        # Only compare pairs ending in this chunk, since the rest were counted with the previous one.
+        # Spans longer than the readings so far have no pairs yet.
+        for span in spans:
+            start = max(len(tail), span)
+            if start < len(readings):
+                num_increases[span] += int(np.count_nonzero(readings[start:] > readings[start - span:len(readings) - span]))
+        tail = readings[-max_span:]
+    return num_increases
+
+def part_1(data: List[int]) -> int:
+    '''Counts the number of times the depth increases.'''
+    return count_increases(data)
+
+def part_2(data: List[int]) -> int:
+    '''Counts the number of times the three-sized sliding window increases.'''
+    return count_increases(data, 3)
+
 def main():
     # Load in the data
     data = load_input('day01/puzzle_input.txt')
     
     print('--- Part 1 ---')
-    print(f'The depth increases {count_increases(data)} times.')
+    print(f'The depth increases {part_1(data)} times.')
     print('')
 
     print('--- Part 2 ---')
-    print(f'The three-sized sliding window increases {count_increases(data, 3)} times.')
+    print(f'The three-sized sliding window increases {part_2(data)} times.')
 
 
 if __name__ == '__main__':
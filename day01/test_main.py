@@ -0,0 +1,25 @@
+import random
+
+from main import count_increases, count_increases_chunked, count_increases_streaming
+
+def write_readings(tmp_path, readings):
+    path = tmp_path / 'readings.txt'
+    path.write_text(''.join(f'{reading}\n' for reading in readings))
+    return str(path)
+
+def test_chunked_handles_fewer_readings_than_span(tmp_path):
+    readings = [199, 200, 208, 210, 200]
+    path = write_readings(tmp_path, readings)
+    spans = [1, 3, 8]
+    expected = {span: count_increases(readings, span) for span in spans}
+    assert count_increases_chunked(path, spans) == expected
+    assert count_increases_chunked(path, spans, chunk_size=4) == expected
+
+def test_chunked_matches_streaming_on_small_chunks(tmp_path):
+    rng = random.Random(1)
+    for _ in range(100):
+        readings = [rng.randrange(1000) for _ in range(rng.randrange(30))]
+        path = write_readings(tmp_path, readings)
+        spans = rng.sample(range(1, 12), 3)
+        chunk_size = rng.randrange(1, 20)
+        assert count_increases_chunked(path, spans, chunk_size) == count_increases_streaming(readings, spans)
@@ -1,15 +1,10 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
 from typing import List, Tuple
 
+from aoc.loader import read_lines
+
 def load_input(path: str) -> List[str]:
     '''Loads the input and returns it as a list of instructions.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        return [line.strip() for line in input_file.readlines()]
+    return read_lines(path)
 
 def apply_steps_naive(steps: List[str]) -> Tuple[int, int]:
     '''Applies the list of steps consecutively, returning the final position.'''
@@ -46,6 +41,16 @@ def apply_steps_with_aim(steps: List[str]) -> Tuple[int, int]:
     return (pos_h, pos_d)
 
 
+def part_1(data: List[str]) -> int:
+    '''Returns the product of the final position components without aim.'''
+    pos_h, pos_d = apply_steps_naive(data)
+    return pos_h * pos_d
+
+def part_2(data: List[str]) -> int:
+    '''Returns the product of the final position components with aim.'''
+    pos_h, pos_d = apply_steps_with_aim(data)
+    return pos_h * pos_d
+
 def main():
     # Load in the data
     data = load_input('day02/puzzle_input.txt')
@@ -1,98 +1,106 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
-from typing import List, Tuple
+from typing import Tuple
 
 import numpy as np
 
-def load_input(path: str) -> np.ndarray:
-    '''Loads the input and returns it as a 2D NumPy array of 1s and 0s.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        data = []
-        for line in input_file.readlines():
-            row = []
-            for bit in line.strip():
-                row.append(int(bit))
-            data.append(row)
-        return np.array(data)
+from aoc.loader import read_digit_grid
 
-def bits_to_decimal(bits: np.ndarray) -> int:
-    '''Given an array of 1s and 0s, returns the decimal value of the bits.'''
-    value = 0
-    for bit in bits:
-        value = (value << 1) + bit
-    return value
+# The readings packed into np.uint64 words, and the number of bits in each reading
+Report = Tuple[np.ndarray, int]
 
-def get_most_common(data: np.ndarray) -> np.ndarray:
-    '''Returns the most common bit in each postion.'''
-    bits = []
-    for pos in range(data.shape[1]):
-        bits.append(np.bincount(data[:, pos]).argmax())
-    return np.array(bits)
+def load_input(path: str) -> Report:
+    '''Loads the input and returns it as the readings packed into words, along with the number of bits.'''
+    bits = read_digit_grid(path)
+    num_bits = bits.shape[1]
+    if num_bits > 64:
+        raise ValueError(f'Readings of {num_bits} bits do not fit in 64-bit words')
+    values = np.zeros(bits.shape[0], dtype=np.uint64)
+    for pos in range(num_bits):
+        values = (values << np.uint64(1)) | bits[:, pos]
+    return values, num_bits
 
-def get_least_common(data: np.ndarray) -> np.ndarray:
-    '''Returns the least common bit in each postion.'''
-    bits = []
-    for pos in range(data.shape[1]):
-        bits.append(np.bincount(data[:, pos]).argmin())
-    return np.array(bits)
+def count_ones(report: Report) -> np.ndarray:
+    '''Counts the readings with a 1 at each bit position, most significant first.
+    Rather than testing every bit of every reading, this takes a histogram of each byte of the
+    words and multiplies it by a table of the bits set in each of the 256 possible bytes.'''
+    values, num_bits = report
+    word_bytes = values.astype('>u8').view(np.uint8).reshape(-1, 8)
+    byte_bits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1).astype(np.int64)
+    counts = np.concatenate([np.bincount(word_bytes[:, i], minlength=256) @ byte_bits for i in range(8)])
+    return counts[64 - num_bits:]
 
-def keep_most_common(data: np.ndarray, pos: int) -> np.ndarray:
-    '''Keeps only the data points where the given position contains the most common value.'''
-    # If most common and least common are equal, keep 1s
-    most_common = get_most_common(data)
-    least_common = get_least_common(data)
-    if most_common[pos] == least_common[pos]:
-        filter = data[:, pos] == 1
-    else:
-        filter = data[:, pos] == most_common[pos]
-    return data[filter]
+def get_rates(report: Report) -> Tuple[int, int]:
+    '''Returns the gamma rate (the most common bits) and the epsilon rate (the least common bits).
+    Where 1s and 0s are equally common, both rates have a 0.'''
+    values, num_bits = report
+    ones = count_ones(report)
+    zeros = len(values) - ones
+    gamma_rate = 0
+    epsilon_rate = 0
+    for num_ones, num_zeros in zip(ones.tolist(), zeros.tolist()):
+        gamma_rate = (gamma_rate << 1) | (num_ones > num_zeros)
+        epsilon_rate = (epsilon_rate << 1) | (num_ones < num_zeros)
+    return gamma_rate, epsilon_rate
 
-def keep_least_common(data: np.ndarray, pos: int) -> np.ndarray:
-    '''Keeps only the data points where the given position contains the least common value.'''
-    # If most common and least common are equal, keep 0s
-    most_common = get_most_common(data)
-    least_common = get_least_common(data)
-    if most_common[pos] == least_common[pos]:
-        filter = data[:, pos] == 0
-    else:
-        filter = data[:, pos] == least_common[pos]
-    return data[filter]
+def filter_rating(report: Report, keep_most_common: bool) -> int:
+    '''Filters the readings by their most (or least) common bit at each position in turn, until one is left.
+    The readings are sorted, so those still left always form a range that shares a prefix, and the
+    readings in it with a 0 at the next position all come before those with a 1. A binary search
+    then splits the range and counts both bits at once.'''
+    values, num_bits = report
+    candidates = np.sort(values)
+    for pos in range(num_bits):
+        if len(candidates) == 1:
+            break
+        bit = 1 << (num_bits - 1 - pos)
+        prefix = (int(candidates[0]) >> (num_bits - pos)) << (num_bits - pos)
+        split = int(np.searchsorted(candidates, np.uint64(prefix | bit)))
+        num_zeros = split
+        num_ones = len(candidates) - split
+        # Ties keep the 1s for the most common and the 0s for the least common
+        if keep_most_common:
+            keep_ones = num_ones >= num_zeros
+        else:
+            keep_ones = num_ones < num_zeros
+        # Never filter out every reading when they all share the bit
+        if num_ones == 0 or num_zeros == 0:
+            keep_ones = num_ones > 0
+        candidates = candidates[split:] if keep_ones else candidates[:split]
+    return int(candidates[0])
+
+def get_oxygen_rating(report: Report) -> int:
+    '''Filters the data down to the oxygen generator rating.'''
+    return filter_rating(report, keep_most_common=True)
+
+def get_co2_rating(report: Report) -> int:
+    '''Filters the data down to the CO2 scrubber rating.'''
+    return filter_rating(report, keep_most_common=False)
+
+def part_1(report: Report) -> int:
+    '''Returns the power consumption of the submarine.'''
+    gamma_rate, epsilon_rate = get_rates(report)
+    return gamma_rate * epsilon_rate
+
+def part_2(report: Report) -> int:
+    '''Returns the life support rating of the submarine.'''
+    return get_oxygen_rating(report) * get_co2_rating(report)
 
 def main():
     # # Load in the data
-    data = load_input('day03/puzzle_input.txt')
+    report = load_input('day03/puzzle_input.txt')
 
-    get_most_common(data)
-    
     print('--- Part 1 ---')
-    gamma_rate = bits_to_decimal(get_most_common(data))
-    epsilon_rate = bits_to_decimal(get_least_common(data))
+    gamma_rate, epsilon_rate = get_rates(report)
     print(f'Gamma rate: {gamma_rate}')
     print(f'Epsilon rate: {epsilon_rate}')
     print(f'Power consumption: {gamma_rate * epsilon_rate}')
     print('')
 
     print('--- Part 2 ---')
-    oxygen_list = data
-    for pos in range(data.shape[1]):
-        oxygen_list = keep_most_common(oxygen_list, pos)
-        if len(oxygen_list) == 1:
-            break
-    oxygen_rating = bits_to_decimal(oxygen_list[0])
+    oxygen_rating = get_oxygen_rating(report)
     print(f'Oxygen generator rating: {oxygen_rating}')
-
-    co2_list = data
-    for pos in range(data.shape[1]):
-        co2_list = keep_least_common(co2_list, pos)
-        if len(co2_list) == 1:
-            break
-    co2_rating = bits_to_decimal(co2_list[0])
+    co2_rating = get_co2_rating(report)
     print(f'CO2 scrubber rating: {co2_rating}')
     print(f'Life support rating: {oxygen_rating * co2_rating}')
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
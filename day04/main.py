@@ -1,61 +1,87 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
-from typing import List, Tuple
-from bingo_board import BingoBoard
-
-def load_input(path: str) -> Tuple[List[int], List[BingoBoard]]:
-    '''Loads the input and returns it as a list of called numbers and a list of bingo boards.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        called_numbers = [int(value) for value in input_file.readline().strip().split(',')]
-        boards = []
-        rows = []
-        while (line := input_file.readline()) != '':
-            if len(line.split()) == 5:
-                rows.append(line.strip())
-            elif len(rows) == 5:
-                boards.append(BingoBoard(rows))
-                rows.clear()
-        return called_numbers, boards
-
-def get_winning_score(called_numbers: List[int], boards: List[BingoBoard]) -> int:
-    '''Plays bingo, returning the score of the first bingo card to win.'''
-    for board in boards:
-        board.clear()
-    for number in called_numbers:
-        for board in boards:
-            board.mark(number)
-            if board.has_won():
-                return board.get_score(number)
-
-def get_losing_score(called_numbers: List[int], boards: List[BingoBoard]) -> int:
-    '''Plays bingo, returning the score of the last bingo card to win.'''
-    for board in boards:
-        board.clear()
-    for number in called_numbers:
-        for board in boards:
-            board.mark(number)
-        for board in boards:
-            if board.has_won():
-                if len(boards) == 1:
-                    return board.get_score(number)
-                else:
-                    boards.remove(board)
+from __future__ import annotations
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+from aoc.loader import read_text
+
+# The called numbers, and every board as an np.ndarray of shape (boards, size, size)
+Bingo = Tuple['np.ndarray', 'np.ndarray']
+
+def load_input(path: str) -> Bingo:
+    '''Loads the input and returns it as an array of called numbers and an array of square bingo boards.'''
+    import numpy as np
+
+    first_line, _, board_text = read_text(path).partition('\n')
+    called_numbers = np.fromstring(first_line, dtype=np.int64, sep=',')
+    size = len(board_text.split('\n', 2)[1].split())
+    boards = np.fromstring(board_text, dtype=np.int64, sep=' ').reshape(-1, size, size)
+    return called_numbers, boards
+
+def get_cell_turns(called_numbers: np.ndarray, boards: np.ndarray) -> np.ndarray:
+    '''Returns the turn on which each number on each board is first called,
+    or the number of turns if it is never called.'''
+    import numpy as np
+
+    num_turns = len(called_numbers)
+    max_number = int(max(called_numbers.max(), boards.max()))
+    draw_turns = np.full(max_number + 1, num_turns, dtype=np.int64)
+    np.minimum.at(draw_turns, called_numbers, np.arange(num_turns))
+    return draw_turns[boards]
+
+def get_win_turns(cell_turns: np.ndarray) -> np.ndarray:
+    '''Returns the turn on which each board wins, or the number of turns if it never does.
+    A row or column is complete on the last turn any of its numbers is called,
+    and a board wins as soon as its first row or column is complete.'''
+    import numpy as np
+
+    row_turns = cell_turns.max(axis=2).min(axis=1)
+    col_turns = cell_turns.max(axis=1).min(axis=1)
+    return np.minimum(row_turns, col_turns)
+
+def get_winners(called_numbers: np.ndarray, boards: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    '''Ranks every board that wins by the turn it wins on, breaking ties by the order of the boards.
+    Returns the indices of the winning boards in order along with their scores.'''
+    import numpy as np
+
+    cell_turns = get_cell_turns(called_numbers, boards)
+    win_turns = get_win_turns(cell_turns)
+    order = np.argsort(win_turns, kind='stable')
+    winners = order[win_turns[order] < len(called_numbers)]
+
+    # A board's score is the sum of its unmarked numbers times the number that made it win
+    winning_turns = win_turns[winners]
+    unmarked = cell_turns[winners] > winning_turns[:, np.newaxis, np.newaxis]
+    unmarked_sums = (boards[winners] * unmarked).sum(axis=(1, 2))
+    return winners, unmarked_sums * called_numbers[winning_turns]
+
+def get_winning_score(called_numbers: np.ndarray, boards: np.ndarray, rank: int = 0) -> int:
+    '''Returns the score of the board that wins in the given place (counting from 0, or from -1 for the last).'''
+    _, scores = get_winners(called_numbers, boards)
+    return int(scores[rank])
+
+def part_1(data: Bingo) -> int:
+    '''Returns the score of the first bingo card to win.'''
+    called_numbers, boards = data
+    return get_winning_score(called_numbers, boards)
+
+def part_2(data: Bingo) -> int:
+    '''Returns the score of the last bingo card to win.'''
+    called_numbers, boards = data
+    return get_winning_score(called_numbers, boards, -1)
 
 def main():
     # Load in the data
-    called_numbers, boards = load_input('day04/puzzle_input.txt')
+    data = load_input('day04/puzzle_input.txt')
 
     print('--- Part 1 ---')
-    print(f'The first board to win gets a score of {get_winning_score(called_numbers, boards)}.')
+    print(f'The first board to win gets a score of {part_1(data)}.')
             
     print('')
 
     print('--- Part 2 ---')
-    print(f'The last board to win gets a score of {get_losing_score(called_numbers, boards)}.')
+    print(f'The last board to win gets a score of {part_2(data)}.')
     
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,62 +1,108 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
-from typing import List, Tuple
-from vent import Vent
-
-def load_input(path: str) -> List[Vent]:
-    '''Loads the input and returns it as a list of Vents.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        vents = []
-        for line in input_file:
-            points = line.strip().split(' -> ')
-            p1 = points[0].split(',')
-            p2 = points[1].split(',')
-            vents.append(Vent(
-                x1=int(p1[0]),
-                y1=int(p1[1]),
-                x2=int(p2[0]),
-                y2=int(p2[1])
-            ))
-        return vents
-
-def mark_vent(grid: List[List[int]], vent: Vent) -> List[List[int]]:
-    '''Marks the given vent on a grid.'''
-    for point in vent.get_covered_points():
-        grid[point[0]][point[1]] += 1
-    return grid
-
-def count_at_least(grid: List[List[int]], at_least: int) -> int:
-    '''Counts the number of grid locations covered by at least the given number of vents.'''
-    count = 0
-    for row in grid:
-        for value in row:
-            if value >= at_least:
-                count += 1
-    return count
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+from aoc.loader import read_text
+from sweep import count_overlaps_sparse
+
+# The most cells a dense grid may have before overlaps are counted with a sweep instead
+MAX_DENSE_CELLS = 1 << 24
+# How many points to rasterize at once
+CHUNK_POINTS = 1 << 16
+
+def load_input(path: str) -> np.ndarray:
+    '''Loads the input and returns the vents as an array of shape (vents, 4), holding x1, y1, x2, y2.'''
+    import numpy as np
+
+    text = read_text(path).replace(' -> ', ',').replace('\n', ',')
+    return np.fromstring(text, dtype=np.int64, sep=',').reshape(-1, 4)
+
+def is_straight(vents: np.ndarray) -> np.ndarray:
+    '''Checks which vents are horizontal or vertical.'''
+    x1, y1, x2, y2 = vents.T
+    return (x1 == x2) | (y1 == y2)
+
+def is_diagonal(vents: np.ndarray) -> np.ndarray:
+    '''Checks which vents are at exactly 45 degrees.'''
+    import numpy as np
+
+    x1, y1, x2, y2 = vents.T
+    return np.abs(x2 - x1) == np.abs(y2 - y1)
+
+def get_lengths(vents: np.ndarray) -> np.ndarray:
+    '''Returns the number of points covered by each vent.'''
+    import numpy as np
+
+    x1, y1, x2, y2 = vents.T
+    return np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1
+
+def rasterize(vents: np.ndarray) -> np.ndarray:
+    '''Returns the x and y coordinates of every point covered by every vent, as an array of shape (2, points).
+    The coordinates have the same type as the vents, so passing int32 vents halves the memory used.'''
+    import numpy as np
+
+    x1, y1, x2, y2 = vents.T
+    lengths = get_lengths(vents)
+    # Each point's vent, and how many steps along that vent it is
+    owners = np.repeat(np.arange(len(vents), dtype=vents.dtype), lengths)
+    steps = np.arange(lengths.sum(), dtype=vents.dtype) - np.repeat(np.cumsum(lengths, dtype=vents.dtype) - lengths, lengths)
+    xs = x1[owners] + np.sign(x2 - x1)[owners] * steps
+    ys = y1[owners] + np.sign(y2 - y1)[owners] * steps
+    return np.stack([xs, ys])
+
+def count_overlaps_dense(vents: np.ndarray, x_min: int, y_min: int, width: int, height: int) -> int:
+    '''Counts the points covered by at least 2 vents by rasterizing them onto a grid
+    of the given bounds, a chunk of vents at a time. Coordinates are shifted to the grid
+    and kept as int32, which the grid size limit leaves plenty of room for.'''
+    import numpy as np
+
+    vents = (vents - np.array([x_min, y_min, x_min, y_min])).astype(np.int32)
+    lengths = get_lengths(vents)
+    # Start a new chunk at the first vent past each multiple of CHUNK_POINTS points
+    chunk_ids = (np.cumsum(lengths, dtype=np.int64) - lengths) // CHUNK_POINTS
+    counts = np.zeros(width * height, dtype=np.int32)
+    for chunk in np.split(vents, np.flatnonzero(np.diff(chunk_ids)) + 1):
+        xs, ys = rasterize(chunk)
+        np.add.at(counts, ys * width + xs, 1)
+    return int(np.count_nonzero(counts >= 2))
+
+def count_overlaps(vents: np.ndarray) -> int:
+    '''Counts the points covered by at least 2 vents. The grid is sized to fit the vents,
+    unless it would be too large, in which case the overlaps are swept instead.'''
+    vents = vents[is_straight(vents) | is_diagonal(vents)]
+    if len(vents) == 0:
+        return 0
+    xs = vents[:, 0::2]
+    ys = vents[:, 1::2]
+    x_min, y_min = int(xs.min()), int(ys.min())
+    width = int(xs.max()) - x_min + 1
+    height = int(ys.max()) - y_min + 1
+    if width * height > MAX_DENSE_CELLS:
+        return count_overlaps_sparse(vents)
+    return count_overlaps_dense(vents, x_min, y_min, width, height)
+
+def part_1(vents: np.ndarray) -> int:
+    '''Counts the spots covered by at least 2 horizontal or vertical vents.'''
+    return count_overlaps(vents[is_straight(vents)])
+
+def part_2(vents: np.ndarray) -> int:
+    '''Counts the spots covered by at least 2 vents.'''
+    return count_overlaps(vents)
 
 def main():
     # Load in the data
     vents = load_input('day05/puzzle_input.txt')
-    grid = [([0] * 1000) for _ in range(1000)]
 
     print('--- Part 1 ---')
-    for vent in vents:
-        if vent.is_horizontal() or vent.is_vertical():
-            grid = mark_vent(grid, vent)
-    print(f'Considering only horizontal and vertical vents, there are {count_at_least(grid, 2)} spots that are at least 2.')
-            
+    print(f'Considering only horizontal and vertical vents, there are {part_1(vents)} spots that are at least 2.')
+
     print('')
-    grid = [([0] * 1000) for _ in range(1000)]
 
     print('--- Part 2 ---')
-    for vent in vents:
-        grid = mark_vent(grid, vent)
-    print(f'Including all vents, there are {count_at_least(grid, 2)} spots that are at least 2.')
+    print(f'Including all vents, there are {part_2(vents)} spots that are at least 2.')
+
 
-    
 if __name__ == '__main__':
     main()
\ No newline at end of file
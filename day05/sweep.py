@@ -0,0 +1,193 @@
+'''Counts the points covered by at least 2 vents without rasterizing them.
+
+Every vent lies on a carrier line from one of four families: rows, columns, diagonals and
+anti-diagonals. Each family is written as a*x + b*y = carrier, and a point on a carrier is
+identified by its position along it, x for every family except columns where it is y.
+
+A point covered twice is either covered twice within a single family, which a sweep over
+each carrier's interval endpoints finds as whole intervals, or it is where coverage from
+two different families crosses. Crossings are points, found for each pair of families by
+sweeping over the carriers of one and binary-searching the carriers of the other that are
+covered there, so the work grows with the number of vents and their crossings (times a log)
+rather than with the area of the grid.
+'''
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# The (a, b) of a*x + b*y = carrier for each family of carrier lines
+FAMILIES = [(0, 1), (1, 0), (-1, 1), (1, 1)]
+ROWS, COLUMNS, DIAGONALS, ANTI_DIAGONALS = range(4)
+
+# Sorted (start, end) intervals along each carrier line, both ends inclusive
+Intervals = Dict[int, List[Tuple[int, int]]]
+
+def get_carriers(vents: np.ndarray, family: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''Returns the carrier of each vent in the family along with the ordered ends of its interval.'''
+    a, b = FAMILIES[family]
+    x1, y1, x2, y2 = vents.T
+    carriers = a * x1 + b * y1
+    if family == COLUMNS:
+        starts, ends = y1, y2
+    else:
+        starts, ends = x1, x2
+    return carriers, starts.clip(max=ends), ends.clip(min=starts)
+
+def get_family(vents: np.ndarray) -> np.ndarray:
+    '''Returns which family of carrier lines each vent lies on.'''
+    import numpy as np
+
+    x1, y1, x2, y2 = vents.T
+    return np.select([y1 == y2, x1 == x2, x2 - x1 == y2 - y1], [ROWS, COLUMNS, DIAGONALS], ANTI_DIAGONALS)
+
+def sweep_family(carriers: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> Tuple[Intervals, Intervals]:
+    '''Sweeps along each carrier line in turn, returning the intervals covered by at least one vent
+    and the intervals covered by at least two.'''
+    import numpy as np
+
+    # Coverage goes up at the start of a vent and down just past its end
+    positions = np.concatenate([starts, ends + 1])
+    changes = np.concatenate([np.ones(len(starts), dtype=np.int64), np.full(len(ends), -1, dtype=np.int64)])
+    carrier_events = np.concatenate([carriers, carriers])
+    order = np.lexsort((positions, carrier_events))
+    covered = {}
+    overlapped = {}
+    depth = 0
+    previous = None
+    for carrier, position, change in zip(carrier_events[order].tolist(), positions[order].tolist(), changes[order].tolist()):
+        if depth > 0 and position > previous:
+            intervals = covered.setdefault(carrier, [])
+            if intervals and intervals[-1][1] == previous - 1:
+                intervals[-1] = (intervals[-1][0], position - 1)
+            else:
+                intervals.append((previous, position - 1))
+            if depth > 1:
+                intervals = overlapped.setdefault(carrier, [])
+                if intervals and intervals[-1][1] == previous - 1:
+                    intervals[-1] = (intervals[-1][0], position - 1)
+                else:
+                    intervals.append((previous, position - 1))
+        depth += change
+        previous = position
+    return covered, overlapped
+
+def to_arrays(intervals: Intervals) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''Flattens the intervals into arrays of carriers, starts and ends.'''
+    import numpy as np
+
+    flat = [(carrier, start, end) for carrier, spans in intervals.items() for start, end in spans]
+    return np.array(flat, dtype=np.int64).reshape(-1, 3).T
+
+def get_cross_ranges(family: int, other_family: int, carriers: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    '''Returns the range of carriers from the other family that each interval passes through.
+    Along a carrier the other family's carrier changes linearly with the position, so the
+    range runs between its values at the two ends of the interval.'''
+    import numpy as np
+
+    a, b = FAMILIES[other_family]
+    ends_carriers = []
+    for positions in (starts, ends):
+        if family == ROWS:
+            xs, ys = positions, carriers
+        elif family == COLUMNS:
+            xs, ys = carriers, positions
+        elif family == DIAGONALS:
+            xs, ys = positions, carriers + positions
+        else:
+            xs, ys = positions, carriers - positions
+        ends_carriers.append(a * xs + b * ys)
+    return np.minimum(*ends_carriers), np.maximum(*ends_carriers)
+
+def sweep_crossings(carriers_1: List[int], lows_1: List[int], highs_1: List[int],
+                    carriers_2: List[int], lows_2: List[int], highs_2: List[int]) -> List[Tuple[int, int]]:
+    '''Finds every (carrier_1, carrier_2) pair where an interval of the first family, spanning
+    carriers lows_1 to highs_1 of the second, meets an interval of the second family, spanning
+    carriers lows_2 to highs_2 of the first. Sweeps over the first family's carriers, keeping the
+    second family's carriers whose interval spans the current one sorted, and binary-searches
+    them for each interval of the first family, so the work grows with the number of intervals
+    and crossings.'''
+    # Events are ordered by carrier, then removals before insertions before queries
+    events = [(low, 1, carrier) for carrier, low in zip(carriers_2, lows_2)]
+    events += [(high + 1, 0, carrier) for carrier, high in zip(carriers_2, highs_2)]
+    events += [(carrier, 2, i) for i, carrier in enumerate(carriers_1)]
+    events.sort()
+    active: List[int] = []
+    crossings = []
+    for position, kind, value in events:
+        if kind == 0:
+            del active[bisect_left(active, value)]
+        elif kind == 1:
+            insort(active, value)
+        else:
+            first = bisect_left(active, lows_1[value])
+            last = bisect_right(active, highs_1[value])
+            crossings.extend((position, carrier) for carrier in active[first:last])
+    return crossings
+
+def get_crossings(family_1: int, intervals_1: Intervals, family_2: int, intervals_2: Intervals) -> np.ndarray:
+    '''Returns the (x, y) points where intervals from two different families cross.'''
+    import numpy as np
+
+    a1, b1 = FAMILIES[family_1]
+    a2, b2 = FAMILIES[family_2]
+    determinant = a1 * b2 - a2 * b1
+    carriers_1, starts_1, ends_1 = to_arrays(intervals_1)
+    carriers_2, starts_2, ends_2 = to_arrays(intervals_2)
+    lows_1, highs_1 = get_cross_ranges(family_1, family_2, carriers_1, starts_1, ends_1)
+    lows_2, highs_2 = get_cross_ranges(family_2, family_1, carriers_2, starts_2, ends_2)
+    # Two carriers only meet on whole coordinates when they agree modulo the determinant, which
+    # is 2 for diagonals against anti-diagonals and 1 otherwise, so sweep each residue separately
+    modulus = abs(determinant)
+    crossings = []
+    for residue in range(modulus):
+        in_1 = carriers_1 % modulus == residue
+        in_2 = carriers_2 % modulus == residue
+        crossings += sweep_crossings(*(values[in_1].tolist() for values in (carriers_1, lows_1, highs_1)),
+                                     *(values[in_2].tolist() for values in (carriers_2, lows_2, highs_2)))
+    if not crossings:
+        return np.empty((0, 2), dtype=np.int64)
+    c1, c2 = np.array(crossings, dtype=np.int64).T
+    # Cramer's rule
+    xs = (c1 * b2 - c2 * b1) // determinant
+    ys = (a1 * c2 - a2 * c1) // determinant
+    return np.stack([xs, ys], axis=1)
+
+def is_within(intervals: Intervals, carrier: int, position: int) -> bool:
+    '''Checks whether the position along the carrier line falls inside one of its intervals.'''
+    spans = intervals.get(carrier)
+    if not spans:
+        return False
+    index = bisect_right(spans, (position, float('inf'))) - 1
+    return index >= 0 and spans[index][1] >= position
+
+def count_overlaps_sparse(vents: np.ndarray) -> int:
+    '''Counts the points covered by at least 2 vents, given as an (N, 4) array of x1, y1, x2, y2,
+    where every vent is horizontal, vertical or at 45 degrees.'''
+    import numpy as np
+
+    families = get_family(vents)
+    covered = {}
+    overlapped = {}
+    for family in range(len(FAMILIES)):
+        family_vents = vents[families == family]
+        if len(family_vents) > 0:
+            covered[family], overlapped[family] = sweep_family(*get_carriers(family_vents, family))
+
+    crossings = [np.empty((0, 2), dtype=np.int64)]
+    present = sorted(covered)
+    for i, family_1 in enumerate(present):
+        for family_2 in present[i + 1:]:
+            crossings.append(get_crossings(family_1, covered[family_1], family_2, covered[family_2]))
+    crossing_points: Set[Tuple[int, int]] = set(map(tuple, np.unique(np.concatenate(crossings), axis=0).tolist()))
+
+    # Overlaps within different families can only meet at crossings, so count each crossing once
+    count = len(crossing_points)
+    for family, intervals in overlapped.items():
+        count += sum(end - start + 1 for spans in intervals.values() for start, end in spans)
+        a, b = FAMILIES[family]
+        for x, y in crossing_points:
+            count -= is_within(intervals, a * x + b * y, y if family == COLUMNS else x)
+    return count
@@ -0,0 +1,99 @@
+'''Projects lanternfish populations any number of days ahead with exact integer arithmetic.
+
+A day is a linear map on the number of fish with each timer value, so n days are the n-th
+power of its transition matrix. The model caches the matrix raised to every power of two it
+has needed so far, and projects a population by applying the cached powers for the set bits
+of n, which takes O(log n) matrix-vector products. The counts grow by about 9% a day, so exact
+counts past a few million days get very large; give a modulus to work with the counts
+modulo it instead.
+'''
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+Matrix = Tuple[Tuple[int, ...], ...]
+
+RESET_TIMER = 6
+SPAWN_TIMER = 8
+
+class LanternfishModel:
+    '''Lanternfish whose timers restart at reset_timer after spawning a fish whose timer starts at spawn_timer.'''
+    def __init__(self, reset_timer: int = RESET_TIMER, spawn_timer: int = SPAWN_TIMER, modulus: Optional[int] = None) -> None:
+        if not 0 <= reset_timer <= spawn_timer:
+            raise ValueError(f'The reset timer must be from 0 to the spawn timer, not {reset_timer}')
+        self.reset_timer = reset_timer
+        self.spawn_timer = spawn_timer
+        self.modulus = modulus
+        self.num_timers = spawn_timer + 1
+        # powers[k] is the transition matrix for 2^k days
+        self.powers = [self.get_transition()]
+
+    def get_transition(self) -> Matrix:
+        '''Returns the matrix taking the fish counts on one day to the counts on the next.'''
+        rows = [[0] * self.num_timers for _ in range(self.num_timers)]
+        for timer in range(self.spawn_timer):
+            rows[timer][timer + 1] = 1
+        rows[self.spawn_timer][0] += 1
+        rows[self.reset_timer][0] += 1
+        return tuple(tuple(row) for row in rows)
+
+    def reduce(self, value: int) -> int:
+        '''Reduces the value by the modulus, if there is one.'''
+        return value if self.modulus is None else value % self.modulus
+
+    def multiply(self, a: Matrix, b: Matrix) -> Matrix:
+        '''Multiplies two matrices.'''
+        columns = list(zip(*b))
+        return tuple(tuple(self.reduce(sum(x * y for x, y in zip(row, column))) for column in columns) for row in a)
+
+    def apply(self, matrix: Matrix, fish_count: Sequence[int]) -> List[int]:
+        '''Multiplies the fish counts by the matrix.'''
+        return [self.reduce(sum(x * y for x, y in zip(row, fish_count))) for row in matrix]
+
+    def get_power(self, exponent: int) -> Matrix:
+        '''Returns the transition matrix for 2^exponent days, squaring the largest cached one as needed.'''
+        while len(self.powers) <= exponent:
+            self.powers.append(self.multiply(self.powers[-1], self.powers[-1]))
+        return self.powers[exponent]
+
+    def normalize(self, fish_count: Sequence[int]) -> List[int]:
+        '''Pads the fish counts with zeros to one count per timer value.'''
+        if len(fish_count) > self.num_timers and any(fish_count[self.num_timers:]):
+            raise ValueError(f'Fish timers must be at most the spawn timer ({self.spawn_timer})')
+        fish_count = list(fish_count[:self.num_timers])
+        return [self.reduce(count) for count in fish_count] + [0] * (self.num_timers - len(fish_count))
+
+    def advance(self, fish_count: Sequence[int], num_days: int) -> List[int]:
+        '''Returns the fish counts for each timer value after the given number of days.'''
+        if num_days < 0:
+            raise ValueError(f'Cannot project a negative number of days: {num_days}')
+        fish_count = self.normalize(fish_count)
+        exponent = 0
+        while num_days > 0:
+            if num_days & 1:
+                fish_count = self.apply(self.get_power(exponent), fish_count)
+            num_days >>= 1
+            exponent += 1
+        return fish_count
+
+    def count_fish(self, fish_count: Sequence[int], num_days: int) -> int:
+        '''Counts the lanternfish after the given number of days.'''
+        return self.reduce(sum(self.advance(fish_count, num_days)))
+
+    def count_fish_batch(self, fish_count: Sequence[int], days: Iterable[int]) -> List[int]:
+        '''Counts the lanternfish after each of the given numbers of days, in the order given.
+        The population is advanced through the days in sorted order, so each query only
+        costs the gap since the previous one.'''
+        days = list(days)
+        counts = [0] * len(days)
+        fish_count = self.normalize(fish_count)
+        current_day = 0
+        for query in sorted(range(len(days)), key=days.__getitem__):
+            fish_count = self.advance(fish_count, days[query] - current_day)
+            current_day = days[query]
+            counts[query] = self.reduce(sum(fish_count))
+        return counts
+
+@lru_cache(maxsize=None)
+def get_model(reset_timer: int = RESET_TIMER, spawn_timer: int = SPAWN_TIMER, modulus: Optional[int] = None) -> LanternfishModel:
+    '''Returns a shared model for the timers, so its cached powers are reused between calls.'''
+    return LanternfishModel(reset_timer, spawn_timer, modulus)
@@ -0,0 +1,81 @@
+'''Finds where crabs should line up using as little fuel as possible.
+
+The crab positions are sorted once and their prefix sums kept, so the fuel to move every
+crab to any position takes one binary search to split the crabs into those on either side.
+Moving a distance d costs d fuel in the linear model and d(d+1)/2 in the triangular model.
+The linear cost is smallest at the median. The triangular cost is the mean of the squared
+and linear costs, and is smallest within half a step of the mean position, so only the few
+whole positions around the mean need checking.
+'''
+from bisect import bisect_right
+from itertools import accumulate
+from operator import mul
+from typing import Iterable, List, Optional, Tuple
+
+LINEAR = 'linear'
+TRIANGULAR = 'triangular'
+COST_MODELS = [LINEAR, TRIANGULAR]
+
+class CrabFuel:
+    '''The sorted crab positions, with everything needed to price a position in O(log n).'''
+    def __init__(self, crab_positions: Iterable[int]) -> None:
+        self.positions = sorted(crab_positions)
+        if len(self.positions) == 0:
+            raise ValueError('There must be at least one crab')
+        self.num_crabs = len(self.positions)
+        self.prefix_sums = [0, *accumulate(self.positions)]
+        self.total = self.prefix_sums[-1]
+        self.total_squares = sum(map(mul, self.positions, self.positions))
+
+    def get_linear_cost(self, position: int) -> int:
+        '''Returns the fuel to move every crab to the position at one fuel per step.'''
+        num_left = bisect_right(self.positions, position)
+        left_sum = self.prefix_sums[num_left]
+        return (position * num_left - left_sum) + (self.total - left_sum - position * (self.num_crabs - num_left))
+
+    def get_squared_cost(self, position: int) -> int:
+        '''Returns the sum of the squared distances of every crab from the position.'''
+        return self.total_squares - 2 * position * self.total + self.num_crabs * position * position
+
+    def get_cost(self, position: int, cost_model: str = LINEAR) -> int:
+        '''Returns the fuel to move every crab to the position using the cost model.'''
+        if cost_model == LINEAR:
+            return self.get_linear_cost(position)
+        if cost_model == TRIANGULAR:
+            return (self.get_squared_cost(position) + self.get_linear_cost(position)) // 2
+        raise ValueError(f'Unknown cost model: {cost_model}')
+
+    def get_candidates(self, cost_model: str) -> List[int]:
+        '''Returns the positions the cheapest position is guaranteed to be among, in ascending order.'''
+        if cost_model == LINEAR:
+            # Every position between the two middle crabs costs the same, so take the lowest
+            return [self.positions[(self.num_crabs - 1) // 2]]
+        if cost_model == TRIANGULAR:
+            mean_floor = self.total // self.num_crabs
+            return [position for position in range(mean_floor - 1, mean_floor + 3)
+                    if self.positions[0] <= position <= self.positions[-1]]
+        raise ValueError(f'Unknown cost model: {cost_model}')
+
+    def get_min_cost(self, cost_model: str = LINEAR) -> Tuple[int, int]:
+        '''Returns the minimum fuel using the cost model and the lowest position that needs it.'''
+        return min((self.get_cost(position, cost_model), position) for position in self.get_candidates(cost_model))
+
+    def get_cost_curve(self, cost_model: str = LINEAR, start: Optional[int] = None, end: Optional[int] = None) -> List[int]:
+        '''Returns the fuel for every position from start to end inclusive, which default to the
+        outermost crabs. The costs are updated a step at a time, since moving one step right adds a
+        step for every crab at or left of the old position and saves one for every crab right of it.'''
+        if cost_model not in COST_MODELS:
+            raise ValueError(f'Unknown cost model: {cost_model}')
+        start = self.positions[0] if start is None else start
+        end = self.positions[-1] if end is None else end
+        linear_cost = self.get_linear_cost(start)
+        squared_cost = self.get_squared_cost(start)
+        num_left = bisect_right(self.positions, start)
+        curve = []
+        for position in range(start, end + 1):
+            curve.append(linear_cost if cost_model == LINEAR else (squared_cost + linear_cost) // 2)
+            while num_left < self.num_crabs and self.positions[num_left] <= position:
+                num_left += 1
+            linear_cost += 2 * num_left - self.num_crabs
+            squared_cost += self.num_crabs * (2 * position + 1) - 2 * self.total
+        return curve
@@ -1,143 +1,145 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
-from typing import Dict, List, Tuple
-
-SEVEN_SEG_MAPPING = {
-    'abcefg': 0,
-    'cf': 1,
-    'acdeg': 2,
-    'acdfg': 3,
-    'bcdf': 4,
-    'abdfg': 5,
-    'abdefg': 6,
-    'acf': 7,
-    'abcdefg': 8,
-    'abcdfg': 9,
-}
-
-def load_input(path: str) -> List[Tuple[List[str], List[str]]]:
-    '''Loads the input and returns it as a list (digits, value) tuples.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        sequences = []
-        for line in input_file:
-            split_line = line.strip().split(' | ')
-            digits = split_line[0].split(' ')
-            value = split_line[1].split(' ')
-            sequences.append((digits, value))
-        return sequences
-
-def count_1478(sequences: List[Tuple[List[str], List[str]]]) -> int:
-    '''Counts the number of occurances of 1, 4, 7, and 8 in the digits of the vlaues.'''
-    count = 0
-    for _, value in sequences:
-        for digit in value:
-            if len(digit) in [2, 3, 4, 7]:
-                count += 1
-    return count
-
-def find_digit_with_length(digits: List[str], length: int) -> str:
-    '''Finds the digit with the given number of letters (segments).'''
-    for digit in digits:
-        if len(digit) == length:
-            return digit
-
-def decode_digit(digit: str, mapping: Dict[str, str]) -> int:
-    '''Decodes the digit using the given mapping.'''
-    decoded_seven_seg = ''
-    for letter in digit:
-        decoded_seven_seg += mapping[letter]
-    return SEVEN_SEG_MAPPING[''.join(sorted(decoded_seven_seg))]
-
-def decode_value(value: List[str], mapping: Dict[str, str]) -> int:
-    '''Decodes the 4-digit value using the given mapping.'''
-    decoded_value = 0
-    for digit in value:
-        decoded_value = (10 * decoded_value) + decode_digit(digit, mapping)
-    return decoded_value
-
-def decode_seven_seg(digits: List[str]) -> Dict[str, str]:
-    '''Uses the 10 unique digits to decode the seven segment display, generating a mapping.'''
-    mapping = {}
-    letter_counts = {
-        'a': 0,
-        'b': 0,
-        'c': 0,
-        'd': 0,
-        'e': 0,
-        'f': 0,
-        'g': 0
-    }
-
-    # Count the number of digits each letter appears in
-    for digit in digits:
-        for letter in digit:
-            letter_counts[letter] += 1
-
-    # Find the letters in a unique number of digits (e in 4, b in 6, f in 9)
-    to_decode = 'abcdefg'
-    for letter in 'abcdefg':
-        if letter_counts[letter] == 4:
-            mapping[letter] = 'e'
-            to_decode = to_decode.replace(letter, '')
-        elif letter_counts[letter] == 6:
-            mapping[letter] = 'b'
-            to_decode = to_decode.replace(letter, '')
-        elif letter_counts[letter] == 9:
-            mapping[letter] = 'f'
-            to_decode = to_decode.replace(letter, '')
-    assert(len(to_decode) == 4)
-    
-    # Since f has already been found, c is the only one left in "1" (the only 2-letter digit)
-    one = find_digit_with_length(digits, 2)
-    for letter in to_decode:
-        if letter in one:
-            mapping[letter] = 'c'
-            to_decode = to_decode.replace(letter, '')
-            break
-    assert(len(to_decode) == 3)
-    
-    # Since c and f have already been found, a is the only one left in "7" (the only 3-letter digit)
-    seven = find_digit_with_length(digits, 3)
-    for letter in to_decode:
-        if letter in seven:
-            mapping[letter] = 'a'
-            to_decode = to_decode.replace(letter, '')
-            break
-    assert(len(to_decode) == 2)
-
-    # Since b, c, and f have already been found, d is the only one left in "4" (the only 4-letter digit)
-    four = find_digit_with_length(digits, 4)
-    for letter in to_decode:
-        if letter in four:
-            mapping[letter] = 'd'
-            to_decode = to_decode.replace(letter, '')
-            break
-    assert(len(to_decode) == 1)
-
-    # The only letter remaining is g
-    mapping[to_decode] = 'g'
-
-    return mapping
+from __future__ import annotations
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+from aoc.loader import read_text
+
+NUM_SEGMENTS = 7
+NUM_PATTERNS = 10
+NUM_OUTPUTS = 4
+# The segments lit for each digit, as 7-bit masks with bit 0 for segment a
+DIGIT_SEGMENTS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+DIGIT_MASKS = [sum(1 << (ord(segment) - ord('a')) for segment in segments) for segments in DIGIT_SEGMENTS]
+
+def get_segment_signature(segment: int) -> int:
+    '''Returns the signature of a segment, which is the same however the wires are crossed:
+    twice the number of digits it is lit in, plus one if it is lit in 4. Segments a and c
+    are both in 8 digits and d and g are both in 7, but only c and d are in 4.'''
+    frequency = sum((mask >> segment) & 1 for mask in DIGIT_MASKS)
+    return 2 * frequency + ((DIGIT_MASKS[4] >> segment) & 1)
+
+class LookupTables(NamedTuple):
+    '''The arrays that parsing and decoding look values up in. A NamedTuple rather than a
+    dataclass, since importing dataclasses alone takes about 20 ms.'''
+    # The bit of each segment
+    segment_bits: np.ndarray
+    # The bit for each of the letters a to g, and no bits for any other character
+    letter_bits: np.ndarray
+    # The number of segments lit by each 7-bit mask
+    popcount: np.ndarray
+    # The digit each 7-bit mask of correctly wired segments shows, or -1 if it shows none
+    digits: np.ndarray
+    # Whether each 7-bit mask has as many segments as 1, 4, 7 or 8, the digits with a unique number
+    unique_lengths: np.ndarray
+    # The segment each wire drives, looked up by the wire's signature, or -1 for impossible signatures
+    signatures: np.ndarray
+
+@lru_cache(maxsize=None)
+def get_tables() -> LookupTables:
+    '''Builds the lookup tables the first time they are needed, so that importing the day doesn't import NumPy.'''
+    import numpy as np
+
+    segment_bits = np.arange(NUM_SEGMENTS, dtype=np.uint8)
+    letter_bits = np.zeros(256, dtype=np.uint8)
+    letter_bits[ord('a'):ord('a') + NUM_SEGMENTS] = 1 << segment_bits
+    popcount = np.array([bin(mask).count('1') for mask in range(1 << NUM_SEGMENTS)], dtype=np.uint8)
+    digits = np.full(1 << NUM_SEGMENTS, -1, dtype=np.int64)
+    digits[DIGIT_MASKS] = np.arange(NUM_PATTERNS)
+    unique_lengths = np.isin(popcount, [2, 3, 4, 7])
+    signatures = np.full(2 * NUM_PATTERNS + 2, -1, dtype=np.int64)
+    signatures[[get_segment_signature(segment) for segment in range(NUM_SEGMENTS)]] = np.arange(NUM_SEGMENTS)
+    return LookupTables(segment_bits, letter_bits, popcount, digits, unique_lengths, signatures)
+
+# The ten unique patterns and the four output digits of every display, as 7-bit masks of shape (displays, 10) and (displays, 4)
+Displays = Tuple['np.ndarray', 'np.ndarray']
+
+def parse_masks(text: str) -> np.ndarray:
+    '''Parses every word of letters a to g in the text into a 7-bit mask, in order.'''
+    import numpy as np
+
+    bits = get_tables().letter_bits[np.frombuffer(text.encode(), dtype=np.uint8)]
+    is_letter = bits > 0
+    # A word starts at each letter that does not follow another letter, and the separators
+    # after it have no bits, so OR-ing from one start to the next gives the word's mask
+    word_starts = np.flatnonzero(is_letter[1:] & ~is_letter[:-1]) + 1
+    if len(bits) > 0 and is_letter[0]:
+        word_starts = np.concatenate([[0], word_starts])
+    if len(word_starts) == 0:
+        return np.empty(0, dtype=np.uint8)
+    return np.bitwise_or.reduceat(bits, word_starts)
+
+def load_input(path: str) -> Displays:
+    '''Loads the input and returns the patterns and output digits of every display as 7-bit masks.'''
+    masks = parse_masks(read_text(path))
+    words_per_line = NUM_PATTERNS + NUM_OUTPUTS
+    if len(masks) % words_per_line != 0:
+        raise ValueError(f'Every display must have {NUM_PATTERNS} patterns and {NUM_OUTPUTS} output digits')
+    masks = masks.reshape(-1, words_per_line)
+    return masks[:, :NUM_PATTERNS], masks[:, NUM_PATTERNS:]
+
+def count_1478(outputs: np.ndarray) -> int:
+    '''Counts the number of occurances of 1, 4, 7, and 8 in the output digits.'''
+    import numpy as np
+
+    return int(np.count_nonzero(get_tables().unique_lengths[outputs]))
+
+def get_wiring(patterns: np.ndarray) -> np.ndarray:
+    '''Returns the segment each wire drives for every display, as an array of shape (displays, 7),
+    by looking up the signature of each wire across the display's ten patterns.'''
+    import numpy as np
+
+    tables = get_tables()
+    frequencies = np.zeros((len(patterns), NUM_SEGMENTS), dtype=np.int64)
+    for wire in range(NUM_SEGMENTS):
+        frequencies[:, wire] = ((patterns >> wire) & 1).sum(axis=1)
+    # 4 is the only digit with 4 segments
+    fours = patterns[np.arange(len(patterns)), np.argmax(tables.popcount[patterns] == 4, axis=1)]
+    in_four = (fours[:, None] >> tables.segment_bits) & 1
+    wiring = tables.signatures[2 * frequencies + in_four]
+    # Every segment must be driven by exactly one wire
+    driven = np.bitwise_or.reduce(np.left_shift(1, wiring, where=wiring >= 0, out=np.zeros_like(wiring)), axis=1)
+    bad_displays = np.flatnonzero(driven != (1 << NUM_SEGMENTS) - 1)
+    if len(bad_displays) > 0:
+        raise ValueError(f'Display {bad_displays[0]} does not have the ten unique digit patterns')
+    return wiring
+
+def decode_displays(patterns: np.ndarray, outputs: np.ndarray) -> np.ndarray:
+    '''Decodes the output value of every display, returning them as an array.'''
+    import numpy as np
+
+    wiring = get_wiring(patterns).astype(np.uint8)
+    # Move each lit wire's bit to the segment it drives
+    segments = np.zeros(outputs.shape, dtype=np.uint8)
+    for wire in range(NUM_SEGMENTS):
+        segments |= ((outputs >> wire) & 1) << wiring[:, wire, None]
+    digits = get_tables().digits[segments]
+    if (digits < 0).any():
+        raise ValueError(f'Display {np.flatnonzero((digits < 0).any(axis=1))[0]} has an output that is not a digit')
+    return digits @ (10 ** np.arange(NUM_OUTPUTS - 1, -1, -1))
+
+def part_1(displays: Displays) -> int:
+    '''Counts the occurrances of 1, 4, 7, and 8 in the values.'''
+    _, outputs = displays
+    return count_1478(outputs)
+
+def part_2(displays: Displays) -> int:
+    '''Decodes every value, returning their sum.'''
+    return int(decode_displays(*displays).sum())
 
 def main():
     # Load in the data
-    sequences = load_input('day08/puzzle_input.txt')
+    displays = load_input('day08/puzzle_input.txt')
 
     print('--- Part 1 ---')
-    print(f'There are {count_1478(sequences)} occurrances of 1, 4, 7, or 8.')
-    
+    print(f'There are {part_1(displays)} occurrances of 1, 4, 7, or 8.')
+
     print('')
 
     print('--- Part 2 ---')
-    total_sum = 0
-    for digits, value in sequences:
-        mapping = decode_seven_seg(digits)
-        total_sum += decode_value(value, mapping)
-    print(f'The total sum of all decoded values is {total_sum}.')
-    
+    print(f'The total sum of all decoded values is {part_2(displays)}.')
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
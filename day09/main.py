@@ -1,85 +1,107 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
-from typing import List, Tuple
+from math import prod
+from typing import Tuple
 
 import numpy as np
 
+from aoc.loader import read_digit_grid
+
 def load_input(path: str) -> np.ndarray:
-    '''Loads the input and returns it as an np.ndarry of ints.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        height_map = []
-        for line in input_file:
-            height_map.append([int(digit) for digit in line.strip()])
-        return np.array(height_map)
-    
-def get_adjacent_coords(coords: Tuple[int, int], shape: Tuple[int, int]) -> List[Tuple[int, int]]:
-    '''Returns a list of all coordinates adjacent to the given coordinate.'''
-    adj_coords = []
-    row, col = coords
-    num_rows, num_cols = shape
+    '''Loads the input and returns it as an np.ndarray of np.uint8 heights.'''
+    return read_digit_grid(path)
 
-    if row > 0:
-        adj_coords.append((row - 1, col))
-    if row < num_rows - 1:
-        adj_coords.append((row + 1, col))
-    if col > 0:
-        adj_coords.append((row, col - 1))
-    if col < num_cols - 1:
-        adj_coords.append((row, col + 1))
-    
-    return adj_coords
+WALL = 9
 
-def is_local_min(coords: Tuple[int, int], height_map: np.ndarray) -> bool:
-    '''Checks if the given coordinates describe a local minimum in the height map.'''
-    for adj_coords in get_adjacent_coords(coords, height_map.shape):
-        if height_map[adj_coords] <= height_map[coords]:
-            return False
-    return True
+def get_local_mins(height_map: np.ndarray) -> np.ndarray:
+    '''Returns the flat indices of all local minima in the height map, found by comparing
+    the whole map with itself shifted one step in each direction.'''
+    is_min = np.ones(height_map.shape, dtype=bool)
+    is_min[1:, :] &= height_map[1:, :] < height_map[:-1, :]
+    is_min[:-1, :] &= height_map[:-1, :] < height_map[1:, :]
+    is_min[:, 1:] &= height_map[:, 1:] < height_map[:, :-1]
+    is_min[:, :-1] &= height_map[:, :-1] < height_map[:, 1:]
+    return np.flatnonzero(is_min)
 
-def get_local_mins(height_map: np.ndarray) -> List[Tuple[int, int]]:
-    '''Returns a list of the coordinates of all local minima in the height map.'''
-    local_mins = []
-    for row in range(height_map.shape[0]):
-        for col in range(height_map.shape[1]):
-            if is_local_min((row, col), height_map):
-                local_mins.append((row, col))
-    return local_mins
+def find_roots(num_nodes: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    '''Finds the connected components of a graph with a vectorized union-find, returning the
+    smallest node in each node's component. Every round hooks the root of the larger node of
+    each edge onto the root of the smaller, then jumps every node straight to its root, and
+    edges are dropped once both ends share a root.'''
+    roots = np.arange(num_nodes, dtype=sources.dtype)
+    while len(sources) > 0:
+        source_roots = roots[sources]
+        target_roots = roots[targets]
+        unmerged = source_roots != target_roots
+        sources = sources[unmerged]
+        targets = targets[unmerged]
+        source_roots = source_roots[unmerged]
+        target_roots = target_roots[unmerged]
+        np.minimum.at(roots, np.maximum(source_roots, target_roots), np.minimum(source_roots, target_roots))
+        while True:
+            grandparents = roots[roots]
+            if np.array_equal(grandparents, roots):
+                break
+            roots = grandparents
+    return roots
 
-def get_basin(local_min: Tuple[int, int], height_map: np.ndarray) -> List[Tuple[int, int]]:
-    '''Gets a list of all coordinates in the basin containing the given local minimum.'''
-    basin_coords = [local_min]
-    to_search = get_adjacent_coords(local_min, height_map.shape)
-    while len(to_search) > 0:
-        coords = to_search.pop()
-        if height_map[coords] == 9:
-            continue
-        basin_coords.append(coords)
-        for adj_coords in get_adjacent_coords(coords, height_map.shape):
-            if adj_coords not in basin_coords and adj_coords not in to_search:
-                to_search.append(adj_coords)
-    return basin_coords
+def label_runs(height_map: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''Splits each row into runs of cells that are not walls. Returns which flat indices are
+    open, the run of every open cell (walls hold the run before them) and the length of every run.'''
+    num_cols = height_map.shape[1]
+    is_open = (height_map != WALL).ravel()
+    # A run can't carry on from the end of the row above, or on to the start of the row below
+    starts = is_open.copy()
+    starts[1:] &= ~is_open[:-1]
+    starts[::num_cols] = is_open[::num_cols]
+    ends = is_open.copy()
+    ends[:-1] &= ~is_open[1:]
+    ends[num_cols - 1::num_cols] = is_open[num_cols - 1::num_cols]
+    runs = np.cumsum(starts, dtype=np.int32) - 1
+    run_lengths = np.flatnonzero(ends) - np.flatnonzero(starts) + 1
+    return is_open, runs, run_lengths
 
+def label_basins(height_map: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    '''Labels every basin, which is a region of cells bounded by walls of height 9. Rows are
+    split into runs, runs that touch in consecutive rows are merged with a union-find, and
+    basin sizes are counted from the run lengths. Returns the basin of every flat index
+    (-1 for walls) and the size of every basin.'''
+    num_cols = height_map.shape[1]
+    is_open, runs, run_lengths = label_runs(height_map)
+    if len(run_lengths) == 0:
+        return np.full(len(is_open), -1, dtype=np.int32), np.zeros(0, dtype=np.int64)
+    # Link the runs above and below the first cell of each stretch of open cells directly over each other
+    stacked = is_open[:-num_cols] & is_open[num_cols:]
+    firsts = stacked.copy()
+    firsts[1:] &= ~stacked[:-1]
+    firsts[::num_cols] = stacked[::num_cols]
+    firsts = np.flatnonzero(firsts)
+    roots = find_roots(len(run_lengths), runs[firsts], runs[firsts + num_cols])
+    basin_sizes = np.bincount(roots, weights=run_lengths, minlength=len(run_lengths)).astype(np.int64)
+    basins = np.where(is_open, roots[runs], -1)
+    return basins, basin_sizes
+
+def part_1(height_map: np.ndarray) -> int:
+    '''Returns the total risk level of all local minima.'''
+    local_mins = get_local_mins(height_map)
+    return int(height_map.ravel()[local_mins].sum(dtype=np.int64)) + len(local_mins)
+
+def part_2(height_map: np.ndarray) -> int:
+    '''Returns the product of the three largest basin sizes.'''
+    basins, basin_sizes = label_basins(height_map)
+    local_min_basins = basins[get_local_mins(height_map)]
+    local_min_basin_sizes = sorted(basin_sizes[local_min_basins[local_min_basins >= 0]].tolist())
+    return prod(local_min_basin_sizes[-3:])
 
 def main():
     # Load in the data
     height_map = load_input('day09/puzzle_input.txt')
 
     print('--- Part 1 ---')
-    total_risk_level = 0
-    for local_min in get_local_mins(height_map):
-        total_risk_level += height_map[local_min] + 1
-    print(f'The total risk level is {total_risk_level}.')
+    print(f'The total risk level is {part_1(height_map)}.')
     
     print('')
 
     print('--- Part 2 ---')
-    local_mins = get_local_mins(height_map)
-    basin_sizes = sorted([len(get_basin(local_min, height_map)) for local_min in local_mins])
-    print(f'The product of the three largest basin sizes is {basin_sizes[-1] * basin_sizes[-2] * basin_sizes[-3]}.')
+    print(f'The product of the three largest basin sizes is {part_2(height_map)}.')
 
     
 if __name__ == '__main__':
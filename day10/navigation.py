@@ -0,0 +1,105 @@
+'''Scores navigation subsystem lines in a single pass each, for files of any size.
+
+Every line is translated into bracket classes first: openers become 0 to 3 and closers 4 to 7
+in the order ( [ { <, and a line holding any other character is rejected. One scan with a
+stack of opener classes then either finds the first closer that doesn't match, making the
+line corrupt, or runs out of characters with openers left on the stack, making it incomplete.
+Large files are split into chunks of whole lines that are scored across a pool of worker
+processes.
+'''
+from functools import partial
+from typing import Iterable, List, Optional, Tuple
+
+from aoc.loader import CHUNK_SIZE, get_line_ranges, read_range
+
+OPENERS = '([{<'
+CLOSERS = ')]}>'
+NUM_KINDS = len(OPENERS)
+BRACKET_CLASSES = str.maketrans({char: chr(kind) for kind, char in enumerate(OPENERS + CLOSERS)})
+# Deletes every bracket, leaving only the characters that don't belong in a line
+NON_BRACKETS = str.maketrans('', '', OPENERS + CLOSERS)
+# Indexed by the class of the closer
+SYNTAX_ERROR_POINT_VALUES = [3, 57, 1197, 25137]
+# Indexed by the class of the opener still to be closed
+AUTOCOMPLETE_POINT_VALUES = [1, 2, 3, 4]
+
+# The total syntax error score of the corrupt lines, and the autocomplete score of each incomplete line
+LineScores = Tuple[int, List[int]]
+
+def score_line(line: str) -> Tuple[int, int]:
+    '''Returns the syntax error score and the autocomplete score of the line.
+    Corrupt lines only get a syntax error score and incomplete lines only an autocomplete score.
+    Raises a ValueError if the line holds anything other than brackets.'''
+    unexpected = line.translate(NON_BRACKETS)
+    if unexpected:
+        raise ValueError(f'Unexpected characters {unexpected!r} in line {line!r}')
+    opens = []
+    for bracket in line.translate(BRACKET_CLASSES).encode():
+        if bracket < NUM_KINDS:
+            opens.append(bracket)
+        elif len(opens) == 0 or opens.pop() != bracket - NUM_KINDS:
+            return SYNTAX_ERROR_POINT_VALUES[bracket - NUM_KINDS], 0
+    score = 0
+    for bracket in reversed(opens):
+        score = 5 * score + AUTOCOMPLETE_POINT_VALUES[bracket]
+    return 0, score
+
+def score_lines(lines: List[str]) -> LineScores:
+    '''Scores every line, returning the total syntax error score and the autocomplete scores.'''
+    syntax_error_score = 0
+    autocomplete_scores = []
+    for line in lines:
+        error_score, autocomplete_score = score_line(line)
+        syntax_error_score += error_score
+        if autocomplete_score > 0:
+            autocomplete_scores.append(autocomplete_score)
+    return syntax_error_score, autocomplete_scores
+
+def score_range(path: str, byte_range: Tuple[int, int]) -> LineScores:
+    '''Scores the lines in the given byte range of the navigation file.'''
+    return score_lines(read_range(path, byte_range).decode().splitlines())
+
+def merge_scores(chunk_scores: Iterable[LineScores]) -> LineScores:
+    '''Merges the scores of consecutive chunks of lines, keeping the autocomplete scores in order.'''
+    syntax_error_score = 0
+    autocomplete_scores = []
+    for chunk_error_score, chunk_autocomplete_scores in chunk_scores:
+        syntax_error_score += chunk_error_score
+        autocomplete_scores += chunk_autocomplete_scores
+    return syntax_error_score, autocomplete_scores
+
+def score_navigation_file(path: str, workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> LineScores:
+    '''Scores every line in the navigation file, splitting it into chunks of whole lines that
+    are scored across a pool of worker processes and then merged in order.'''
+    from concurrent.futures import ProcessPoolExecutor
+
+    score = partial(score_range, path)
+    ranges = get_line_ranges(path, chunk_size)
+    if workers is not None and workers <= 1:
+        return merge_scores(map(score, ranges))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_scores(executor.map(score, ranges))
+
+def select(values: List[int], rank: int, seed: Optional[int] = None) -> int:
+    '''Returns the value that would be at the given index if the values were sorted, using
+    quickselect with random pivots, which takes linear time on average.'''
+    from random import Random
+
+    if not 0 <= rank < len(values):
+        raise IndexError(f'Rank {rank} is out of range for {len(values)} values')
+    rng = Random(seed)
+    while True:
+        pivot = values[rng.randrange(len(values))]
+        lower = [value for value in values if value < pivot]
+        if rank < len(lower):
+            values = lower
+            continue
+        num_equal = sum(1 for value in values if value == pivot)
+        if rank < len(lower) + num_equal:
+            return pivot
+        rank -= len(lower) + num_equal
+        values = [value for value in values if value > pivot]
+
+def get_middle_score(autocomplete_scores: List[int]) -> int:
+    '''Returns the middle of an odd number of autocomplete scores.'''
+    return select(autocomplete_scores, len(autocomplete_scores) // 2)
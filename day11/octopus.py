@@ -0,0 +1,68 @@
+'''Simulates a grid of flashing octopuses of any shape, a whole wave of flashes at a time.
+
+Every step raises each energy level by one, then flashes spread in waves: each octopus that
+went above 9 in the last wave raises its 8 neighbours by one, which can push more of them
+above 9 for the next wave. The neighbour counts of a wave are summed for the whole grid at
+once as a 3x3 box sum of the new flashes, done as a sum of shifted rows followed by a sum of
+shifted columns. A flashing octopus also counts itself in the box, which does no harm since
+it has already flashed. A boolean mask of the octopuses that have not flashed yet keeps each
+one to a single flash per step. All the scratch arrays are allocated once, up front.
+'''
+import numpy as np
+
+FLASH_LEVEL = 9
+
+class FlashSimulator:
+    '''Steps a copy of a grid of energy levels, counting the flashes.'''
+    def __init__(self, energies: np.ndarray) -> None:
+        if energies.ndim != 2:
+            raise ValueError(f'Energy levels must be a 2D grid, not {energies.ndim}D')
+        self.energies = energies.astype(np.uint8)
+        self.num_steps = 0
+        # The octopuses that flashed in the last wave, and those that haven't flashed this step
+        self.new_flashes = np.zeros(energies.shape, dtype=bool)
+        self.unflashed = np.zeros(energies.shape, dtype=bool)
+        self.row_sums = np.zeros(energies.shape, dtype=np.uint8)
+        self.box_sums = np.zeros(energies.shape, dtype=np.uint8)
+
+    def add_box_sums(self) -> None:
+        '''Raises the energy of every octopus in the 3x3 box around each new flash by one.'''
+        flashes = self.new_flashes.view(np.uint8)
+        rows = self.row_sums
+        np.copyto(rows, flashes)
+        rows[1:] += flashes[:-1]
+        rows[:-1] += flashes[1:]
+        boxes = self.box_sums
+        np.copyto(boxes, rows)
+        boxes[:, 1:] += rows[:, :-1]
+        boxes[:, :-1] += rows[:, 1:]
+        self.energies += boxes
+
+    def step(self) -> int:
+        '''Performs a single step, returning the number of flashes.'''
+        self.num_steps += 1
+        energies = self.energies
+        energies += 1
+        new_flashes = np.greater(energies, FLASH_LEVEL, out=self.new_flashes)
+        if not new_flashes.any():
+            return 0
+        unflashed = np.logical_not(new_flashes, out=self.unflashed)
+        while True:
+            self.add_box_sums()
+            np.greater(energies, FLASH_LEVEL, out=new_flashes)
+            new_flashes &= unflashed
+            if not new_flashes.any():
+                break
+            unflashed ^= new_flashes
+        energies[~unflashed] = 0
+        return energies.size - int(np.count_nonzero(unflashed))
+
+    def run(self, num_steps: int) -> int:
+        '''Performs the given number of steps, returning the total number of flashes.'''
+        return sum(self.step() for _ in range(num_steps))
+
+    def find_synchronized_step(self) -> int:
+        '''Steps until every octopus flashes during the same step, returning that step's number.'''
+        while self.step() < self.energies.size:
+            pass
+        return self.num_steps
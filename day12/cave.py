@@ -1,12 +1,105 @@
-class Cave:
-
-    def __init__(self, name):
-        self.links = []
-        self.name = name
-        self.is_small = name.islower()
-    
-    def add_link(self, cave):
-        self.links.append(cave)
-    
-    def __eq__(self, other):
-        return self.name == other.name
\ No newline at end of file
+from typing import Dict, List, Tuple
+
+START = 'start'
+END = 'end'
+
+class CaveGraph:
+    '''A cave system with only the small caves as nodes, numbered from 0 so that a set of them
+    fits in an int bitmask. Big caves are collapsed into the links between the small caves
+    around them: each link is weighted by the number of ways to step between its two small
+    caves, either directly or through any one big cave. A big cave linked to a small cave on
+    both sides gives a link from the small cave back to itself.'''
+
+    def __init__(self, links: List[Tuple[str, str]]) -> None:
+        neighbors: Dict[str, List[str]] = {}
+        for name_1, name_2 in links:
+            neighbors.setdefault(name_1, []).append(name_2)
+            neighbors.setdefault(name_2, []).append(name_1)
+        if START not in neighbors or END not in neighbors:
+            raise ValueError(f'The cave system needs both a {START} and an {END} cave')
+
+        self.names = sorted(name for name in neighbors if name.islower())
+        self.ids = {name: idx for idx, name in enumerate(self.names)}
+        self.start = self.ids[START]
+        self.end = self.ids[END]
+        weights: List[Dict[int, int]] = [{} for _ in self.names]
+        for name in self.names:
+            steps = []
+            for adj_name in neighbors[name]:
+                if adj_name.islower():
+                    steps.append(adj_name)
+                    continue
+                for next_name in neighbors[adj_name]:
+                    if not next_name.islower():
+                        raise ValueError(f'Big caves {adj_name} and {next_name} are linked, so there are infinitely many paths')
+                    steps.append(next_name)
+            for next_name in steps:
+                next_id = self.ids[next_name]
+                weights[self.ids[name]][next_id] = weights[self.ids[name]].get(next_id, 0) + 1
+        # Nothing ever steps back into the start, or on from the end
+        self.links = [
+            [] if idx == self.end else [(next_id, weight) for next_id, weight in cave_weights.items() if next_id != self.start]
+            for idx, cave_weights in enumerate(weights)
+        ]
+        # The small caves a path can step to from each cave, as a bitmask
+        self.link_masks = [sum(1 << next_id for next_id, _ in cave_links) for cave_links in self.links]
+        self.memo: Dict[Tuple[int, int, int, bool], int] = {}
+
+    def flood(self, caves: int, visited: int) -> int:
+        '''Returns every cave reachable from the given caves by stepping through unvisited caves.
+        Paths stop at the end, so nothing is reached through it.'''
+        reached = caves
+        frontier = caves
+        while frontier:
+            next_frontier = 0
+            while frontier:
+                bit = frontier & -frontier
+                frontier ^= bit
+                if bit != 1 << self.end:
+                    next_frontier |= self.link_masks[bit.bit_length() - 1]
+            next_frontier &= ~visited & ~reached
+            reached |= next_frontier
+            frontier = next_frontier
+        return reached
+
+    def get_region(self, cave: int, visited: int, can_revisit: bool) -> int:
+        '''Returns every cave the rest of a path from the cave could pass through. That is the
+        caves reachable through unvisited caves, and if a revisit is still allowed, the visited
+        caves next to those along with everything reachable from them in turn.'''
+        region = self.flood(1 << cave, visited)
+        if can_revisit:
+            revisits = 0
+            remaining = region
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                if bit != 1 << self.end:
+                    revisits |= self.link_masks[bit.bit_length() - 1]
+            region |= self.flood(revisits & visited & ~region, visited)
+        return region
+
+    def count_paths_from(self, cave: int, visited: int, can_revisit: bool) -> int:
+        '''Counts the paths from the cave to the end that avoid the visited small caves,
+        except for a single revisit if one is still allowed.'''
+        if cave == self.end:
+            return 1
+        # Caves outside the region can't affect the rest of the path, so leave them out of the key
+        region = self.get_region(cave, visited, can_revisit)
+        key = (cave, region, visited & region, can_revisit)
+        num_paths = self.memo.get(key)
+        if num_paths is not None:
+            return num_paths
+        num_paths = 0
+        for next_cave, weight in self.links[cave]:
+            bit = 1 << next_cave
+            if not visited & bit:
+                num_paths += weight * self.count_paths_from(next_cave, visited | bit, can_revisit)
+            elif can_revisit:
+                num_paths += weight * self.count_paths_from(next_cave, visited, False)
+        self.memo[key] = num_paths
+        return num_paths
+
+    def count_paths(self, allow_double_small: bool) -> int:
+        '''Counts the paths from the start to the end that visit each small cave at most once,
+        or a single one of them twice if allowed.'''
+        return self.count_paths_from(self.start, 1 << self.start, allow_double_small)
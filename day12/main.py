@@ -1,68 +1,35 @@
-from errno import ENOENT
-from os import name, strerror
-from os.path import exists
-from typing import List, Dict
+from aoc.loader import read_lines
+from cave import CaveGraph
 
-from cave import Cave
+def load_input(path: str) -> CaveGraph:
+    '''Loads the input and returns it as a graph of the small caves.'''
+    return CaveGraph([tuple(line.split('-')) for line in read_lines(path)])
 
-def load_input(path: str) -> Dict[str, Cave]:
-    '''Loads the input and returns it as a dictionary of caves by name.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        caves_by_name = {}
-        for line in [line.strip() for line in input_file.readlines()]:
-            link = line.split('-')
-            name_1 = link[0]
-            name_2 = link[1]
-            if name_1 not in caves_by_name:
-                caves_by_name[name_1] = Cave(name_1)
-            if name_2 not in caves_by_name:
-                caves_by_name[name_2] = Cave(name_2)
-            caves_by_name[name_1].add_link(caves_by_name[name_2])
-            caves_by_name[name_2].add_link(caves_by_name[name_1])
-        return caves_by_name
+def get_num_paths(caves: CaveGraph, allow_double_small: bool) -> int:
+    '''Counts the paths through the caves, memoizing on the current cave, the set of small
+    caves visited so far and whether a small cave may still be visited twice.'''
+    return caves.count_paths(allow_double_small)
 
-def has_double_small(path: List[Cave]) -> bool:
-    for cave in path:
-        if cave.is_small and path.count(cave) >= 2:
-            return True
-    return False
+def part_1(caves: CaveGraph) -> int:
+    '''Counts the paths that visit small caves at most once.'''
+    return get_num_paths(caves, False)
 
-def get_num_paths(start: Cave, end: Cave, path: List[Cave], allow_double_small: bool) -> int:
-    path.append(start)
-    if start == end:
-        return 1
-    num_paths = 0
-    for cave in start.links:
-        # Start is only allowed once
-        if cave.name == 'start':
-            continue
-        # Maybe allow one double small
-        if allow_double_small:
-            if has_double_small(path) and cave.is_small and cave in path:
-                continue
-        else:
-            if cave.is_small and cave in path:
-                continue
-        num_paths += get_num_paths(cave, end, path[:], allow_double_small)
-    return num_paths
+def part_2(caves: CaveGraph) -> int:
+    '''Counts the paths that visit a single small cave at most twice.'''
+    return get_num_paths(caves, True)
 
 def main():
     # Load in the data
-    # caves_by_name = load_input('day12/test_input.txt')
-    caves_by_name = load_input('day12/puzzle_input.txt')
+    # caves = load_input('day12/test_input.txt')
+    caves = load_input('day12/puzzle_input.txt')
 
     print('--- Part 1 ---')
-    num_paths = get_num_paths(caves_by_name['start'], caves_by_name['end'], [], False)
-    print(f'Paths with no double smalls: {num_paths}')
+    print(f'Paths with no double smalls: {part_1(caves)}')
     
     print('')
 
     print('--- Part 2 ---')
-    num_paths = get_num_paths(caves_by_name['start'], caves_by_name['end'], [], True)
-    print(f'Paths with no more than 1 double small: {num_paths}')
+    print(f'Paths with no more than 1 double small: {part_2(caves)}')
     
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,101 +1,104 @@
-from errno import ENOENT
-from os import name, strerror
-from os.path import exists
 from typing import List, Tuple
 
 import numpy as np
 
-def load_input(path: str) -> Tuple[np.ndarray, List[str, int]]:
-    '''Loads the input and returns it as a grid and a list of folds.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        dots = []
-        while (line := input_file.readline().strip()) != '':
-            coords = line.split(',')
-            dots.append((int(coords[1]), int(coords[0])))
-        folds = []
-        while (line := input_file.readline().strip()) != '':
-            axis = line.split()[-1].split('=')
-            folds.append((axis[0], int(axis[1])))
-    
-    # Create a grid
-    y_max = np.max([dot[0] for dot in dots])
-    x_max = np.max([dot[1] for dot in dots])
-    grid = []
-    for y in range(y_max + 1):
-        row = []
-        for x in range(x_max + 1):
-            row.append(False)
-        grid.append(row)
-    
-    # Add the dots to the grid
-    grid = np.array(grid)
-    for dot in dots:
-        grid[dot] = True
-    return grid, folds
-
-def do_fold(grid: np.ndarray, fold: Tuple[str, int]) -> np.ndarray:
-    '''Performs a fold on the grid, returning the folded grid.'''
-    dir = fold[0]
-    value = fold[1]
-
-    # Get the size of the folded grid
-    y_size = grid.shape[0]
-    x_size = grid.shape[1]
-    if dir == 'x':
-        x_size = value
-    else:
-        y_size = value
-
-    # Populate the folded grid
-    folded_grid = []
-    for y in range(y_size):
-        row = []
-        for x in range(x_size):
-            if dir == 'x':
-                offset = value - x
-                is_dot = grid[y, x] or grid[y, value + offset]
-            else:
-                offset = value - y
-                is_dot = grid[y, x] or grid[value + offset, x]
-            row.append(is_dot)
-        folded_grid.append(row)
-    return np.array(folded_grid)
-
-def count_dots(grid: np.ndarray) -> int:
-    '''Counts the number of dots in the grid.'''
-    return np.count_nonzero(grid)
+from aoc.loader import read_text
+
+# A fold is the axis it folds along and the coordinate of the fold line
+Fold = Tuple[str, int]
+AXES = 'xy'
+
+def load_input(path: str) -> Tuple[np.ndarray, List[Fold]]:
+    '''Loads the input and returns it as an array of (x, y) dots of shape (dots, 2) and a list of folds.'''
+    dot_text, _, fold_text = read_text(path).partition('\n\n')
+    dots = np.fromstring(dot_text.replace('\n', ','), dtype=np.int64, sep=',').reshape(-1, 2)
+    folds = []
+    for line in fold_text.splitlines():
+        axis = line.split()[-1].split('=')
+        folds.append((axis[0], int(axis[1])))
+    return dots, folds
+
+def get_fold_map(size: int, lines: List[int]) -> np.ndarray:
+    '''Composes folds along a single axis into one map from each coordinate below size to where
+    it ends up after every fold, or -1 if it lands on a fold line or off the folded sheet.'''
+    coords = np.arange(size, dtype=np.int64)
+    for line in lines:
+        coords = np.where((coords == line) | (coords > 2 * line), -1, np.where(coords > line, 2 * line - coords, coords))
+    return coords
+
+def get_distinct(keys: np.ndarray, num_keys: int) -> np.ndarray:
+    '''Returns the distinct keys from 0 to num_keys - 1 in ascending order. Marking the keys in
+    a boolean table is fastest when there aren't many more possible keys than keys, otherwise
+    the keys are sorted and each run of equal keys kept once. Both are much faster than
+    np.unique, which hashes integer keys first and slows down badly with millions of them.'''
+    if num_keys <= 8 * len(keys):
+        present = np.zeros(num_keys, dtype=bool)
+        present[keys] = True
+        return np.flatnonzero(present)
+    keys = np.sort(keys)
+    return keys[np.concatenate([[True], keys[1:] != keys[:-1]])]
+
+def do_folds(dots: np.ndarray, folds: List[Fold]) -> np.ndarray:
+    '''Performs every fold on the dots in one pass, returning the distinct folded dots.'''
+    if len(dots) == 0:
+        return dots
+    folded = np.empty_like(dots)
+    for col, axis in enumerate(AXES):
+        fold_map = get_fold_map(int(dots[:, col].max()) + 1, [line for fold_axis, line in folds if fold_axis == axis])
+        folded[:, col] = fold_map[dots[:, col]]
+    folded = folded[(folded >= 0).all(axis=1)]
+    if len(folded) == 0:
+        return folded
+    # Pack each dot into a single int so duplicates can be found in one dimension
+    width = int(folded[:, 0].max()) + 1
+    keys = get_distinct(folded[:, 1] * width + folded[:, 0], width * (int(folded[:, 1].max()) + 1))
+    return np.stack([keys % width, keys // width], axis=1)
+
+def get_sheet_shape(dots: np.ndarray, folds: List[Fold]) -> Tuple[int, int]:
+    '''Returns the (height, width) of the sheet after the folds. Each fold cuts the sheet
+    off at its fold line, and an axis that is never folded keeps the extent of the dots.'''
+    sizes = [int(dots[:, col].max()) + 1 if len(dots) > 0 else 0 for col in range(len(AXES))]
+    for axis, line in folds:
+        sizes[AXES.index(axis)] = line
+    width, height = sizes
+    return height, width
+
+def rasterize(dots: np.ndarray, shape: Tuple[int, int]) -> np.ndarray:
+    '''Draws the dots onto a boolean grid of the given shape.'''
+    grid = np.zeros(shape, dtype=bool)
+    grid[dots[:, 1], dots[:, 0]] = True
+    return grid
+
+def grid_to_str(grid: np.ndarray) -> str:
+    '''Draws the grid as a string.'''
+    return '\n'.join(''.join(row) for row in np.where(grid, '#', ' ').tolist())
 
 def print_grid(grid: np.ndarray) -> None:
     '''Prints the grid.'''
-    for y in range(grid.shape[0]):
-        row = ''
-        for x in range(grid.shape[1]):
-            if grid[y, x]:
-                row += '#'
-            else:
-                row += ' '
-        print(row)
+    print(grid_to_str(grid))
+
+def part_1(data: Tuple[np.ndarray, List[Fold]]) -> int:
+    '''Counts the dots after the first fold.'''
+    dots, folds = data
+    return len(do_folds(dots, folds[:1]))
+
+def part_2(data: Tuple[np.ndarray, List[Fold]]) -> str:
+    '''Performs every fold, returning the sheet drawn as a string.'''
+    dots, folds = data
+    return grid_to_str(rasterize(do_folds(dots, folds), get_sheet_shape(dots, folds)))
 
 def main():
     # Load in the data
-    # grid, folds = load_input('day13/test_input.txt')
-    grid, folds = load_input('day13/puzzle_input.txt')
+    # data = load_input('day13/test_input.txt')
+    data = load_input('day13/puzzle_input.txt')
 
     print('--- Part 1 ---')
-    grid = do_fold(grid, folds[0])
-    print(f'After 1 fold there are {count_dots(grid)} dots.')
+    print(f'After 1 fold there are {part_1(data)} dots.')
     
     print('')
-    # grid, folds = load_input('day13/test_input.txt')
-    grid, folds = load_input('day13/puzzle_input.txt')
 
     print('--- Part 2 ---')
-    for fold in folds:
-        grid = do_fold(grid, fold)
-    print_grid(grid)
+    print(part_2(data))
     
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,195 @@
+'''Polymerizes a template any number of steps ahead with exact integer arithmetic.
+
+A polymer is tracked as the count of each pair of adjacent elements, in an array of 26 * 26
+counts indexed by the letter codes of the pair. A rule splits one pair into two, so a step is
+a sparse transition matrix with at most two entries per pair. It is stored grouped by target
+pair, so a step is one gather and one np.add.reduceat.
+
+Counts stay int64 while they provably fit. The total number of pairs at most doubles each step,
+so T pairs can take 62 - log2(T) steps before any count could overflow. Within that range, long
+runs of steps use powers of two of the transition matrix, restricted to the pairs that can ever
+occur from the template's pairs and squared with int64 matmul. Those powers are cached, so such
+a run takes O(log steps) matrix-vector products once they are built. Past that range the counts
+become Python ints in an object array and steps are taken one at a time through the sparse
+matrix, since with numbers that large a dense matrix product costs far more than the additions
+of a sparse step.
+'''
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+NUM_LETTERS = 26
+NUM_PAIRS = NUM_LETTERS * NUM_LETTERS
+# int64 counts are kept below 2^MAX_TOTAL_BITS pairs in total
+MAX_TOTAL_BITS = 62
+
+def get_letter_code(letter: str) -> int:
+    '''Returns the code of an element letter from A to Z.'''
+    code = ord(letter) - ord('A')
+    if not 0 <= code < NUM_LETTERS:
+        raise ValueError(f'Elements must be letters from A to Z, not {letter!r}')
+    return code
+
+def get_pair_index(letter_1: str, letter_2: str) -> int:
+    '''Returns the index of a pair of element letters.'''
+    return get_letter_code(letter_1) * NUM_LETTERS + get_letter_code(letter_2)
+
+def get_safe_steps(pair_counts: np.ndarray) -> int:
+    '''Returns how many steps int64 pair counts can take before any count could overflow.'''
+    return max(0, MAX_TOTAL_BITS - int(pair_counts.sum()).bit_length())
+
+class PairPowers:
+    '''The powers of two of the step map as int64 matrices, restricted to a set of pairs that steps never leave.'''
+    def __init__(self, pairs: Sequence[int], targets: List[Tuple[int, ...]]) -> None:
+        import numpy as np
+
+        self.pairs = np.array(pairs, dtype=np.int64)
+        self.pair_set = frozenset(pairs)
+        positions = {pair: position for position, pair in enumerate(pairs)}
+        step_map = np.zeros((len(pairs), len(pairs)), dtype=np.int64)
+        for position, pair in enumerate(pairs):
+            for target in targets[pair]:
+                step_map[positions[target], position] += 1
+        # powers[k] is the map for 2^k steps
+        self.powers = [step_map]
+
+    def get_power(self, exponent: int) -> np.ndarray:
+        '''Returns the map for 2^exponent steps, squaring the largest cached one as needed.
+        An entry of the map for n steps is at most 2^n, so squaring is exact for n up to 31.'''
+        while len(self.powers) <= exponent:
+            self.powers.append(self.powers[-1] @ self.powers[-1])
+        return self.powers[exponent]
+
+    def advance(self, pair_counts: np.ndarray, num_steps: int) -> np.ndarray:
+        '''Returns the int64 pair counts after the given number of steps, which must be within get_safe_steps.'''
+        import numpy as np
+
+        counts = pair_counts[self.pairs]
+        exponent = 0
+        while num_steps > 0:
+            if num_steps & 1:
+                counts = self.get_power(exponent) @ counts
+            num_steps >>= 1
+            exponent += 1
+        advanced = np.zeros_like(pair_counts)
+        advanced[self.pairs] = counts
+        return advanced
+
+class PolymerModel:
+    '''The pair insertion rules, compiled into a sparse map of the pairs each pair turns into on a step.'''
+    def __init__(self, rules: Dict[str, str]) -> None:
+        import numpy as np
+
+        self.targets: List[Tuple[int, ...]] = [(pair,) for pair in range(NUM_PAIRS)]
+        for pair, inserted in rules.items():
+            self.targets[get_pair_index(pair[0], pair[1])] = (
+                get_pair_index(pair[0], inserted),
+                get_pair_index(inserted, pair[1])
+            )
+        # Every (source, target) entry of the step map, grouped by target
+        sources = np.array([pair for pair in range(NUM_PAIRS) for _ in self.targets[pair]], dtype=np.int64)
+        targets = np.array([target for pair in range(NUM_PAIRS) for target in self.targets[pair]], dtype=np.int64)
+        order = np.argsort(targets, kind='stable')
+        self.sources = sources[order]
+        targets = targets[order]
+        self.group_starts = np.flatnonzero(np.concatenate([[True], targets[1:] != targets[:-1]]))
+        self.group_targets = targets[self.group_starts]
+        self.powers: List[PairPowers] = []
+
+    def count_pairs(self, template: str) -> np.ndarray:
+        '''Returns the int64 count of each pair of adjacent elements in the template.'''
+        import numpy as np
+
+        pair_counts = np.zeros(NUM_PAIRS, dtype=np.int64)
+        for letter_1, letter_2 in zip(template, template[1:]):
+            pair_counts[get_pair_index(letter_1, letter_2)] += 1
+        return pair_counts
+
+    def step(self, pair_counts: np.ndarray) -> np.ndarray:
+        '''Applies the rules once, to int64 counts or to Python int counts in an object array.'''
+        import numpy as np
+
+        new_counts = np.zeros_like(pair_counts)
+        new_counts[self.group_targets] = np.add.reduceat(pair_counts[self.sources], self.group_starts)
+        return new_counts
+
+    def get_closure(self, pair_counts: np.ndarray) -> FrozenSet[int]:
+        '''Returns every pair that can occur after any number of steps from the pair counts.'''
+        import numpy as np
+
+        closure = set(np.flatnonzero(pair_counts).tolist())
+        to_visit = list(closure)
+        while to_visit:
+            for target in self.targets[to_visit.pop()]:
+                if target not in closure:
+                    closure.add(target)
+                    to_visit.append(target)
+        return frozenset(closure)
+
+    def find_powers(self, pair_counts: np.ndarray) -> Optional[PairPowers]:
+        '''Returns cached powers covering every pair in the pair counts, if there are any.'''
+        import numpy as np
+
+        pairs = np.flatnonzero(pair_counts).tolist()
+        for powers in self.powers:
+            if powers.pair_set.issuperset(pairs):
+                return powers
+        return None
+
+    def advance_int64(self, pair_counts: np.ndarray, num_steps: int) -> np.ndarray:
+        '''Returns the int64 pair counts after a number of steps within get_safe_steps. Steps are
+        taken one at a time unless that would cost more than squaring the map for the pairs that
+        can occur, which is about the cube of their number.'''
+        powers = self.find_powers(pair_counts)
+        if powers is None:
+            closure = self.get_closure(pair_counts)
+            if num_steps * len(self.sources) <= len(closure) ** 3:
+                for _ in range(num_steps):
+                    pair_counts = self.step(pair_counts)
+                return pair_counts
+            powers = PairPowers(sorted(closure), self.targets)
+            self.powers.append(powers)
+        return powers.advance(pair_counts, num_steps)
+
+    def advance(self, pair_counts: np.ndarray, num_steps: int) -> np.ndarray:
+        '''Returns the pair counts after the given number of steps. Counts stay int64 for as
+        many steps as they safely can, then carry on as Python ints in an object array.'''
+        if num_steps < 0:
+            raise ValueError(f'Cannot polymerize a negative number of steps: {num_steps}')
+        if pair_counts.dtype != object:
+            safe_steps = min(num_steps, get_safe_steps(pair_counts))
+            pair_counts = self.advance_int64(pair_counts, safe_steps)
+            num_steps -= safe_steps
+            if num_steps > 0:
+                pair_counts = pair_counts.astype(object)
+        for _ in range(num_steps):
+            pair_counts = self.step(pair_counts)
+        return pair_counts
+
+    def get_histogram(self, pair_counts: np.ndarray, last_letter: str) -> Dict[str, int]:
+        '''Counts each element in the polymer with the given pair counts and last element.
+        Every element but the last is the first of exactly one pair.'''
+        import numpy as np
+
+        histogram = {last_letter: 1}
+        pairs = np.flatnonzero(pair_counts)
+        for pair, count in zip(pairs.tolist(), pair_counts[pairs].tolist()):
+            letter = chr(ord('A') + pair // NUM_LETTERS)
+            histogram[letter] = histogram.get(letter, 0) + count
+        return histogram
+
+    def get_histograms(self, template: str, steps: Iterable[int]) -> List[Dict[str, int]]:
+        '''Returns the element histogram after each of the given numbers of steps, in the order
+        given. The polymer is advanced through the step counts in sorted order, so each one
+        only costs the gap since the previous one.'''
+        steps = list(steps)
+        histograms: List[Dict[str, int]] = [{} for _ in steps]
+        pair_counts = self.count_pairs(template)
+        current_step = 0
+        for query in sorted(range(len(steps)), key=steps.__getitem__):
+            pair_counts = self.advance(pair_counts, steps[query] - current_step)
+            current_step = steps[query]
+            histograms[query] = self.get_histogram(pair_counts, template[-1])
+        return histograms
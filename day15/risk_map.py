@@ -0,0 +1,38 @@
+'''Views a cave's risk map as a base tile repeated any number of times across and down.
+
+Only the base tile is stored. The risk of a cell is looked up in the base tile at the cell's
+position within its tile, then raised by the tile's row plus its column, wrapping from 9 back
+around to 1. Cells are addressed by flat index into the whole tiled map, and whole arrays of
+them are looked up at once, so a search can ask for the risks of a frontier in one go.
+'''
+from typing import Tuple, Union
+
+import numpy as np
+
+MAX_RISK = 9
+
+class TiledRiskMap:
+    '''A base tile of risks from 1 to 9, repeated the given number of tiles down and across.'''
+    def __init__(self, tile: np.ndarray, num_tiles: Union[int, Tuple[int, int]] = 1) -> None:
+        if tile.ndim != 2 or tile.size == 0:
+            raise ValueError(f'The base tile must be a non-empty 2D grid, not of shape {tile.shape}')
+        if tile.min() < 1 or tile.max() > MAX_RISK:
+            raise ValueError(f'Risks must be from 1 to {MAX_RISK}')
+        if isinstance(num_tiles, int):
+            num_tiles = (num_tiles, num_tiles)
+        if min(num_tiles) < 1:
+            raise ValueError(f'There must be at least one tile each way, not {num_tiles}')
+        self.tile = np.ascontiguousarray(tile, dtype=np.uint8).ravel()
+        self.tile_shape: Tuple[int, int] = tile.shape
+        self.num_tiles: Tuple[int, int] = num_tiles
+        self.shape = (tile.shape[0] * num_tiles[0], tile.shape[1] * num_tiles[1])
+        self.size = self.shape[0] * self.shape[1]
+
+    def take(self, idxs: np.ndarray) -> np.ndarray:
+        '''Returns the risks of the cells at the given flat indices into the tiled map.'''
+        tile_rows, tile_cols = self.tile_shape
+        rows, cols = np.divmod(idxs, self.shape[1])
+        tile_row, row = np.divmod(rows, tile_rows)
+        tile_col, col = np.divmod(cols, tile_cols)
+        risks = self.tile[row * tile_cols + col] + tile_row + tile_col
+        return ((risks - 1) % MAX_RISK + 1).astype(np.uint8)
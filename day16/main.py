@@ -1,9 +1,7 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
-
 from packets import Packet, convert_to_packet
 
+from aoc.loader import read_text
+
 hex_to_bin = {
     '0': '0000',
     '1': '0001',
@@ -25,15 +23,17 @@ hex_to_bin = {
 
 def load_input(path: str) -> Packet:
     '''Loads the input and returns it as a Packet.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        hex_string = input_file.readline().strip()
-        bit_string = ''
-        for nibble in hex_string:
-            bit_string += hex_to_bin[nibble]
-        return convert_to_packet(bit_string)
+    hex_string = read_text(path).strip()
+    bit_string = ''.join(hex_to_bin[nibble] for nibble in hex_string)
+    return convert_to_packet(bit_string)
+
+def part_1(packet: Packet) -> int:
+    '''Returns the sum of the versions of every packet.'''
+    return packet.get_version_sum()
+
+def part_2(packet: Packet) -> int:
+    '''Returns the value of the outermost packet.'''
+    return packet.get_value()
 
 def main():
     # Load in the data
@@ -41,12 +41,12 @@ def main():
     packet = load_input('day16/puzzle_input.txt')
 
     print('--- Part 1 ---')
-    print(f'Packet version sum: {packet.get_version_sum()}')
+    print(f'Packet version sum: {part_1(packet)}')
 
     print('')
 
     print('--- Part 2 ---')
-    print(f'Packet value: {packet.get_value()}')
+    print(f'Packet value: {part_2(packet)}')
     
 if __name__ == '__main__':
     main()
\ No newline at end of file
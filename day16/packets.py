@@ -1,8 +1,7 @@
 from abc import ABC, abstractmethod
+from math import inf
 from typing import List
 
-import numpy as np
-
 class Packet(ABC):
     '''A packet of data.'''
     version: int
@@ -99,7 +98,7 @@ class Product(Operator):
 class Minimum(Operator):
     '''A minimum operator.'''
     def get_value(self) -> int:
-        value = np.inf
+        value = inf
         for packet in self.subpackets:
             value = min(value, packet.get_value())
         return value
@@ -1,19 +1,13 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
 from typing import List, Tuple
 import re
 
-def load_input(path: str) -> None:
+from aoc.loader import read_text
+
+def load_input(path: str) -> Tuple[Tuple[int, int], Tuple[int, int]]:
     '''Loads the input and returns it as the x and y ranges of the target area.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        line = input_file.readline().strip()
-        match = re.search(r'target area: x=(-?\d+)\.\.(-?\d+), y=(-?\d+)\.\.(-?\d+)', line)
-        x_min, x_max, y_min, y_max = match.groups()
-        return (int(x_min), int(x_max)), (int(y_min), int(y_max))
+    match = re.search(r'target area: x=(-?\d+)\.\.(-?\d+), y=(-?\d+)\.\.(-?\d+)', read_text(path))
+    x_min, x_max, y_min, y_max = match.groups()
+    return (int(x_min), int(x_max)), (int(y_min), int(y_max))
 
 def triangle_number(n: int) -> int:
     '''Returns the nth triangle number.'''
@@ -114,19 +108,29 @@ def get_valid_vels(x_range: Tuple[int, int], y_range: Tuple[int, int]) -> List[T
                     break
     return valid_vels
 
+def part_1(target: Tuple[Tuple[int, int], Tuple[int, int]]) -> int:
+    '''Returns the highest y value reachable while still hitting the target.'''
+    _, y_range = target
+    largest_valid_y_vel = get_valid_y_vels(y_range)[-1]
+    return triangle_number(largest_valid_y_vel)
+
+def part_2(target: Tuple[Tuple[int, int], Tuple[int, int]]) -> int:
+    '''Counts the initial velocities that hit the target.'''
+    x_range, y_range = target
+    return len(get_valid_vels(x_range, y_range))
+
 def main():
     # Load in the data
-    # x_range, y_range = load_input('day17/test_input.txt')
-    x_range, y_range = load_input('day17/puzzle_input.txt')
+    # target = load_input('day17/test_input.txt')
+    target = load_input('day17/puzzle_input.txt')
 
     print('--- Part 1 ---')
-    largest_valid_y_vel = get_valid_y_vels(y_range)[-1]
-    print(f'Highest possible y value: {triangle_number(largest_valid_y_vel)}')
+    print(f'Highest possible y value: {part_1(target)}')
 
     print('')
 
     print('--- Part 2 ---')
-    print(f'Number of valid velocities: {len(get_valid_vels(x_range, y_range))}')
+    print(f'Number of valid velocities: {part_2(target)}')
     
 if __name__ == '__main__':
     main()
\ No newline at end of file
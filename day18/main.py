@@ -1,20 +1,12 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
 from typing import List, Union
 
+from aoc.loader import read_lines
+
 SFNum = List[Union[str, int]]
 
 def load_input(path: str) -> List[SFNum]:
     '''Loads the input and returns it as a list of snailfish numbers.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        sf_nums = []
-        for line in input_file:
-            sf_nums.append(str_to_sf_num(line.strip()))
-        return sf_nums
+    return [str_to_sf_num(line) for line in read_lines(path)]
 
 def str_to_sf_num(sf_str: str) -> SFNum:
     '''Converts a string to a snailfish number.'''
@@ -93,25 +85,33 @@ def add_sf_nums(sf_num_1, sf_num_2):
     '''Adds two snailfish number and reduces the sum.'''
     return reduce(['['] + sf_num_1 + sf_num_2 + [']'])
         
+def part_1(sf_nums: List[SFNum]) -> int:
+    '''Returns the magnitude of the sum of all the snailfish numbers.'''
+    sf_sum = sf_nums[0]
+    for sf_num in sf_nums[1:]:
+        sf_sum = add_sf_nums(sf_sum, sf_num)
+    return get_magnitude(sf_sum)
+
+def part_2(sf_nums: List[SFNum]) -> int:
+    '''Returns the largest magnitude of the sum of any two snailfish numbers.'''
+    max_magnitude = 0
+    for sf_num_1 in sf_nums:
+        for sf_num_2 in sf_nums:
+            max_magnitude = max(max_magnitude, get_magnitude(add_sf_nums(sf_num_1, sf_num_2)))
+    return max_magnitude
+
 def main():
     # Load in the data
     # sf_nums = load_input('day18/test_input.txt')
     sf_nums = load_input('day18/puzzle_input.txt')
 
     print('--- Part 1 ---')
-    sf_sum = sf_nums[0]
-    for sf_num in sf_nums[1:]:
-        sf_sum = add_sf_nums(sf_sum, sf_num)
-    print(f'Magnitude of the final sum: {get_magnitude(sf_sum)}')
+    print(f'Magnitude of the final sum: {part_1(sf_nums)}')
 
     print('')
 
     print('--- Part 2 ---')
-    max_magnitude = 0
-    for sf_num_1 in sf_nums:
-        for sf_num_2 in sf_nums:
-            max_magnitude = max(max_magnitude, get_magnitude(add_sf_nums(sf_num_1, sf_num_2)))
-    print(f'Maximum magnitude: {max_magnitude}')
+    print(f'Maximum magnitude: {part_2(sf_nums)}')
     
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,34 +1,27 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
 from typing import List
 
 from sensors import Beacon, Scanner
 
+from aoc.loader import read_text
+
 def load_input(path: str) -> List[Scanner]:
     '''Loads the input and returns it as a list of Scanners.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        input_str = ''
-        for line in input_file:
-            input_str += line
-        scanner_inputs = input_str.split('\n\n')
-        scanners = []
-        for scanner_input in scanner_inputs:
-            beacon_strs = scanner_input.strip().split('\n')[1:]
-            beacons = []
-            for beacon_str in beacon_strs:
-                coords = beacon_str.split(',')
-                beacons.append(Beacon(int(coords[0]), int(coords[1]), int(coords[2])))
-            scanners.append(Scanner(beacons))
-        return scanners
+    scanner_inputs = read_text(path).split('\n\n')
+    scanners = []
+    for scanner_input in scanner_inputs:
+        beacon_strs = scanner_input.strip().split('\n')[1:]
+        beacons = []
+        for beacon_str in beacon_strs:
+            coords = beacon_str.split(',')
+            beacons.append(Beacon(int(coords[0]), int(coords[1]), int(coords[2])))
+        scanners.append(Scanner(beacons))
+    return scanners
 
 def align_scanners(scanners: List[Scanner]) -> Scanner:
     '''Aligns all the scanners, returning the map as a single scanner with all the beacons.'''
     map = Scanner(scanners[0].beacons[:])
-    to_align = scanners[1:]
+    # Align copies so the given scanners can be aligned again
+    to_align = [Scanner(scanner.beacons[:]) for scanner in scanners[1:]]
     final_scanners = []
     print(f'Scanners left to align: {len(to_align)}')
     while len(to_align) > 0:
@@ -50,6 +43,21 @@ def get_dist(scanner_1: Scanner, scanner_2: Scanner) -> int:
     z_dist = abs(scanner_1.translation[2] - scanner_2.translation[2])
     return x_dist + y_dist + z_dist
         
+def part_1(scanners: List[Scanner]) -> int:
+    '''Counts the total number of beacons once all the scanners are aligned.'''
+    map, _ = align_scanners(scanners)
+    return len(map.beacons)
+
+def part_2(scanners: List[Scanner]) -> int:
+    '''Returns the largest Manhattan distance between any two aligned scanners.'''
+    _, aligned_scanners = align_scanners(scanners)
+    max_dist = 0
+    for scanner_1 in aligned_scanners:
+        for scanner_2 in aligned_scanners:
+            dist = get_dist(scanner_1, scanner_2)
+            max_dist = max(max_dist, dist)
+    return max_dist
+
 def main():
     # Load in the data
     # scanners = load_input('day19/test_input.txt')
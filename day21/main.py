@@ -1,20 +1,12 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
 from typing import List, Tuple
 
 from dirac import Die, Player
 
+from aoc.loader import read_lines
+
 def load_input(path: str) -> List[Player]:
     '''Loads the input and returns it as a list of players.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        players = []
-        for line in input_file:
-            players.append(Player(int(line.split()[-1])))
-        return players
+    return [Player(int(line.split()[-1])) for line in read_lines(path)]
 
 def play_game(players: List[Player], end_score: int) -> int:
     '''Plays a game of Dirac Dice with a deterministic D100.
@@ -73,20 +65,26 @@ def play_quantum_game(players: List[Player], end_score: int) -> List[int]:
         universe_counts = next_universe_counts
     return win_counts
 
+def part_1(players: List[Player]) -> int:
+    '''Plays with a deterministic D100, returning the loser's points times the number of rolls.'''
+    return play_game([Player(player.position, player.points) for player in players], 1000)
+
+def part_2(players: List[Player]) -> int:
+    '''Plays with a quantum D3, returning the number of universes the overall winner wins in.'''
+    return max(play_quantum_game(players, 21))
+
 def main():
     # Load in the data
     # players = load_input('day21/test_input.txt')
     players = load_input('day21/puzzle_input.txt')
 
     print('--- Part 1 ---')
-    print(f'Loser points * number of rolls: {play_game(players, 1000)}')
+    print(f'Loser points * number of rolls: {part_1(players)}')
 
     print('')
-    # players = load_input('day21/test_input.txt')
-    players = load_input('day21/puzzle_input.txt')
 
     print('--- Part 2 ---')
-    print(f'The overall winner wins in {max(play_quantum_game(players, 21))} universes.')
+    print(f'The overall winner wins in {part_2(players)} universes.')
     
 if __name__ == '__main__':
     main()
\ No newline at end of file
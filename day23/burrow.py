@@ -2,6 +2,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Tuple
 
+from aoc.grid import OFFSETS_4
+
 Coords = Tuple[int, int]
 ENERGY_PER_STEP = {
     'A': 1,
@@ -9,6 +11,15 @@ ENERGY_PER_STEP = {
     'C': 100,
     'D': 1000
 }
+ROOM_COLS = {
+    'A': 3,
+    'B': 5,
+    'C': 7,
+    'D': 9
+}
+# The contents of a space, indexed by its code in an encoded burrow
+SPACE_CONTENTS = '.ABCD'
+BITS_PER_SPACE = 3
 
 @dataclass
 class Burrow:
@@ -18,10 +29,10 @@ class Burrow:
         '''Returns a list of all vacant spaces adjacent to the given coordinates.'''
         row, col = coords
         adj_coords = []
-        for adj_coord in [(row-1, col), (row+1, col), (row, col-1), (row, col+1)]:
-            adj_row, adj_col = adj_coord
+        for row_offset, col_offset in OFFSETS_4:
+            adj_row, adj_col = row + row_offset, col + col_offset
             if self.layout[adj_row][adj_col] == '.':
-                adj_coords.append(adj_coord)
+                adj_coords.append((adj_row, adj_col))
         return adj_coords
     
     def get_wrong_amphipods_in_room(self, col: int, desired_apod: str) -> List[Tuple[Coords, str]]:
@@ -132,11 +143,11 @@ class Burrow:
 
         # Use Depth First Search to get all valid coords
         valid_coords = []
-        visited = []
+        visited = set()
         coords_to_try = [(start, 0)]
         while len(coords_to_try) > 0:
             coords, steps = coords_to_try.pop()
-            visited.append(coords)
+            visited.add(coords)
             for adj_coords in self.get_vacant_neighbors(coords):
                 if adj_coords in visited:
                     continue
@@ -179,6 +190,24 @@ class Burrow:
                 next_burrows.append((burrow_after_move, energy))
         return next_burrows
     
+    def get_min_energy_remaining(self) -> int:
+        '''Returns a lower bound on the energy needed to organize the burrow, counting the steps
+        each amphipod that still needs to move must take to reach its room, ignoring all others.'''
+        min_energy = 0
+        for (row, col), apod in self.get_wrong_amphipods():
+            room_col = ROOM_COLS[apod]
+            if row == 1:
+                # Across the hallway and into the room
+                steps = abs(col - room_col) + 1
+            elif col != room_col:
+                # Out of this room, across the hallway and into the right room
+                steps = (row - 1) + abs(col - room_col) + 1
+            else:
+                # Out of its own room to make way, a step aside and back, then back in
+                steps = (row - 1) + 3
+            min_energy += ENERGY_PER_STEP[apod] * steps
+        return min_energy
+
     def as_string(self) -> str:
         '''Gets a string representation of the burrow.'''
         burrow_str = ''
@@ -190,15 +219,43 @@ class Burrow:
         '''Compares the string representation of each burrow to determine equality.'''
         return self.as_string() == other.as_string()
 
+class BurrowCodec:
+    '''Encodes burrows with the same walls as a single int, using 3 bits for the contents of each open space.'''
+    def __init__(self, burrow: Burrow) -> None:
+        self.walls = [[char if char not in SPACE_CONTENTS else '.' for char in line] for line in burrow.layout]
+        self.spaces = []
+        for row, line in enumerate(burrow.layout):
+            for col, char in enumerate(line):
+                if char in SPACE_CONTENTS:
+                    self.spaces.append((row, col))
+        self.shifts = {coords: i * BITS_PER_SPACE for i, coords in enumerate(self.spaces)}
+
+    def encode(self, burrow: Burrow) -> int:
+        '''Packs the contents of every open space of the burrow into an int.'''
+        state = 0
+        for i, (row, col) in enumerate(self.spaces):
+            state |= SPACE_CONTENTS.index(burrow.layout[row][col]) << (i * BITS_PER_SPACE)
+        return state
+
+    def decode(self, state: int) -> Burrow:
+        '''Unpacks an int into a burrow.'''
+        layout = [line[:] for line in self.walls]
+        for row, col in self.spaces:
+            layout[row][col] = SPACE_CONTENTS[state & ((1 << BITS_PER_SPACE) - 1)]
+            state >>= BITS_PER_SPACE
+        return Burrow([''.join(line) for line in layout])
+
+    def move(self, state: int, start: Coords, end: Coords) -> int:
+        '''Returns the encoded burrow after moving the amphipod at the start coords to the (empty) end coords.'''
+        start_shift = self.shifts[start]
+        apod_code = (state >> start_shift) & ((1 << BITS_PER_SPACE) - 1)
+        return state ^ (apod_code << start_shift) ^ (apod_code << self.shifts[end])
+
 @dataclass
 class Node:
     burrow: Burrow
     energy: int
 
-    def __lt__(self, other: Node):
-        '''Compares energy of each node.'''
-        return self.energy < other.energy
-
     def as_string(self) -> str:
         '''Gets a string representation of the node.'''
         return f'Energy: {self.energy}\n{self.burrow.as_string()}'
\ No newline at end of file
@@ -1,8 +1,7 @@
-from errno import ENOENT
-from os import strerror
-from os.path import exists
 from typing import List, Tuple
 
+from aoc.loader import read_lines
+
 REG_IDX = {
     'w': 0,
     'x': 1,
@@ -12,11 +11,7 @@ REG_IDX = {
 
 def load_input(path: str) -> List[str]:
     '''Loads the input and returns it as a list of instructions.'''
-    if not exists(path):
-        raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-    
-    with open(path, 'r') as input_file:
-        return [line.strip() for line in input_file]
+    return read_lines(path)
 
 def get_b_val(b: str, regs: List[int]) -> int:
     '''Gets the value of b, either a register value or an immediate value.'''
@@ -75,23 +70,31 @@ def run_program(instructions: List[str], input_str: str) -> List[int]:
         regs, input_str = process_instruction(instruction, regs, input_str)
     return regs
 
+def part_1(monad: List[str]) -> int:
+    '''Verifies and returns the largest valid model number.'''
+    model_number = 91699394894995
+    assert run_program(monad, f'{model_number:014}')[REG_IDX['z']] == 0
+    return model_number
+
+def part_2(monad: List[str]) -> int:
+    '''Verifies and returns the smallest valid model number.'''
+    model_number = 51147191161261
+    assert run_program(monad, f'{model_number:014}')[REG_IDX['z']] == 0
+    return model_number
+
 def main():
     # Load in the data
     monad = load_input('day24/puzzle_input.txt')
 
     print('--- Part 1 ---')
     # Verify the answer to Part 1
-    model_number = 91699394894995
-    assert run_program(monad, f'{model_number:014}')[REG_IDX['z']] == 0
-    print(f'Largest valid model number: {model_number}')
+    print(f'Largest valid model number: {part_1(monad)}')
 
     print('')
 
     print('--- Part 2 ---')
     # Verify the answer to Part 2
-    model_number = 51147191161261
-    assert run_program(monad, f'{model_number:014}')[REG_IDX['z']] == 0
-    print(f'Smallest valid model number: {model_number}')
+    print(f'Smallest valid model number: {part_2(monad)}')
     
 if __name__ == '__main__':
     main()
\ No newline at end of file